@@ -0,0 +1,74 @@
+# anomaly_detector.py — Persistent IsolationForest scoring over a sliding window of live samples (UI-free)
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+import diagnostics
+
+
+class AnomalyService:
+    """Keeps one IsolationForest per (features, contamination) and refits it periodically.
+
+    Rows from every snapshot are appended to a sliding window; the model is
+    refit on that window every `refit_rows` new rows or `refit_seconds`,
+    whichever comes first. Scoring between refits is a cheap predict /
+    decision_function call, so flags stay consistent from cycle to cycle.
+    """
+
+    def __init__(self, features, contamination=0.2, window=5000, refit_rows=500, refit_seconds=60.0,
+                 min_rows=5, random_state=42):
+        self.features = list(features)
+        self.contamination = contamination
+        self.refit_rows, self.refit_seconds, self.min_rows = refit_rows, refit_seconds, min_rows
+        self.random_state = random_state
+        self._window = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._model = None
+        self._since_fit, self._fit_at = 0, 0.0
+        self._seen = deque(maxlen=64)  # snapshot stamps already folded into the window
+        self.fits = 0
+
+    def _due(self):
+        if len(self._window) < self.min_rows:
+            return False
+        if self._model is None:
+            return True
+        return self._since_fit >= self.refit_rows or time.time() - self._fit_at >= self.refit_seconds
+
+    def _fit(self):
+        from sklearn.ensemble import IsolationForest
+        with diagnostics.span("anomaly.fit"):
+            model = IsolationForest(contamination=self.contamination, random_state=self.random_state)
+            model.fit(np.asarray(self._window, dtype=np.float64))
+        self._model, self._since_fit, self._fit_at = model, 0, time.time()
+        self.fits += 1
+
+    def observe(self, X, stamp=None):
+        """Fold new rows into the window (once per snapshot `stamp`) and refit if due"""
+        with self._lock:
+            if stamp is not None:
+                if stamp in self._seen:
+                    return
+                self._seen.append(stamp)
+            self._window.extend(map(tuple, X))
+            self._since_fit += len(X)
+            if self._due():
+                self._fit()
+
+    def score(self, X):
+        """(labels, scores): labels are 'Anomaly'/'Normal', lower scores are more anomalous"""
+        with self._lock:
+            model = self._model
+        if model is None or len(X) == 0:
+            return np.full(len(X), "Normal", dtype=object), np.zeros(len(X))
+        with diagnostics.span("anomaly.score"):
+            scores = model.decision_function(X)
+            return np.where(model.predict(X) == -1, "Anomaly", "Normal").astype(object), scores
+
+    def update(self, df, stamp=None):
+        """observe() then score() the feature columns of `df`"""
+        X = df[self.features].fillna(0).to_numpy(np.float64)
+        self.observe(X, stamp)
+        return self.score(X)
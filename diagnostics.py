@@ -0,0 +1,185 @@
+# diagnostics.py — Lightweight timing spans + cProfile capture for the dashboard (UI-free)
+import cProfile
+import io
+import json
+import marshal
+import os
+import pstats
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+
+# numpy is imported inside the readers: recording spans must not pull it into a cold start
+
+
+class SpanRecorder:
+    """Rolling per-span duration windows (milliseconds), safe to feed from any thread.
+
+    Each span name keeps its last `window` durations, so the histogram and
+    percentiles describe recent behaviour rather than the whole uptime.
+    """
+
+    def __init__(self, window=500):
+        self.window = window
+        self._lock = threading.Lock()
+        self._spans = {}    # name -> deque of ms
+        self._counts = {}   # name -> total observations since reset
+
+    def record(self, name, ms):
+        with self._lock:
+            buf = self._spans.get(name)
+            if buf is None:
+                buf = self._spans[name] = deque(maxlen=self.window)
+            buf.append(ms)
+            self._counts[name] = self._counts.get(name, 0) + 1
+
+    @contextmanager
+    def span(self, name):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - t0) * 1e3)
+
+    def timed(self, name):
+        """Decorator form of span()"""
+        def deco(fn):
+            @wraps(fn)
+            def inner(*args, **kwargs):
+                with self.span(name):
+                    return fn(*args, **kwargs)
+            return inner
+        return deco
+
+    def names(self):
+        with self._lock:
+            return sorted(self._spans)
+
+    def samples(self, name):
+        import numpy as np
+        with self._lock:
+            return np.asarray(self._spans.get(name, ()), dtype=np.float64)
+
+    def stats(self):
+        """One row per span: count, last, mean, p50/p95/p99 and max over the window (ms)"""
+        import numpy as np
+        with self._lock:
+            snap = {k: (np.asarray(v, dtype=np.float64), self._counts[k]) for k, v in self._spans.items()}
+        rows = []
+        for name, (ms, count) in sorted(snap.items()):
+            p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+            rows.append({"span": name, "count": count, "last_ms": float(ms[-1]), "mean_ms": float(ms.mean()),
+                         "p50_ms": float(p50), "p95_ms": float(p95), "p99_ms": float(p99), "max_ms": float(ms.max())})
+        return rows
+
+    def histogram(self, name, bins=20):
+        """(counts, edges) of the span's window on a log-spaced ms axis"""
+        import numpy as np
+        ms = self.samples(name)
+        if ms.size == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0)
+        lo, hi = max(ms.min(), 1e-3), max(ms.max(), 1e-3)
+        edges = np.geomspace(lo, hi * 1.0001, bins + 1) if hi > lo else np.array([lo, lo * 1.0001])
+        counts, edges = np.histogram(np.clip(ms, lo, None), bins=edges)
+        return counts, edges
+
+    def to_json(self):
+        with self._lock:
+            raw = {k: list(v) for k, v in self._spans.items()}
+        return json.dumps({"created": time.time(), "window": self.window, "stats": self.stats(), "samples_ms": raw},
+                          indent=2)
+
+    def reset(self):
+        with self._lock:
+            self._spans.clear()
+            self._counts.clear()
+
+
+_recorder = SpanRecorder()
+
+
+def get_recorder():
+    """Process-wide recorder shared by the dashboard, the sampler thread and the anomaly service"""
+    return _recorder
+
+
+def span(name):
+    return _recorder.span(name)
+
+
+def timed(name):
+    return _recorder.timed(name)
+
+
+_first_run = True
+
+
+def record_first_run(label, ms):
+    """Record a script run as 'cold start' if it is the first in this server process"""
+    global _first_run
+    if _first_run:
+        _first_run = False
+        _recorder.record(f"cold start · {label}", ms)
+
+
+# ---------------- Import cost ----------------
+_HEAVY = ("numpy", "pandas", "pyarrow", "plotly.express", "psutil", "sklearn", "fpdf")
+
+_IMPORT_PROBE = r"""
+import json, sys, time
+t0 = time.perf_counter(); import streamlit; base = time.perf_counter() - t0
+before = set(sys.modules)
+t1 = time.perf_counter(); __import__(sys.argv[1]); own = time.perf_counter() - t1
+print(json.dumps({"base": base, "own": own, "loaded": [m for m in sys.argv[2:] if m in sys.modules and m not in before]}))
+"""
+
+
+def measure_imports(modules, cwd=None):
+    """Import each module in a fresh interpreter (after streamlit) and report its own cost and heavy deps pulled in"""
+    cwd = cwd or os.path.dirname(os.path.abspath(__file__))
+    rows = []
+    for module in modules:
+        out = subprocess.run([sys.executable, "-c", _IMPORT_PROBE, module, *_HEAVY], cwd=cwd,
+                             capture_output=True, text=True, timeout=120)
+        if out.returncode != 0:
+            rows.append({"module": module, "error": (out.stderr.strip().splitlines() or ["failed"])[-1]})
+            continue
+        r = json.loads(out.stdout.strip().splitlines()[-1])
+        rows.append({"module": module, "import_ms": r["own"] * 1e3, "streamlit_ms": r["base"] * 1e3,
+                     "heavy_deps": ", ".join(r["loaded"])})
+    return rows
+
+
+# ---------------- cProfile ----------------
+def start_profile():
+    prof = cProfile.Profile()
+    prof.enable()
+    return prof
+
+
+def stop_profile(prof):
+    """Disable `prof` and return its stats as a pstats-loadable dump (bytes)"""
+    prof.disable()
+    prof.create_stats()
+    return marshal.dumps(prof.stats)
+
+
+class _Loaded:
+    """pstats.Stats accepts any object with create_stats() and a stats dict"""
+
+    def __init__(self, stats):
+        self.stats = stats
+
+    def create_stats(self):
+        pass
+
+
+def profile_summary(dump, sort="cumulative", limit=25):
+    """Text table of the top `limit` functions in a stop_profile() dump"""
+    out = io.StringIO()
+    pstats.Stats(_Loaded(marshal.loads(dump)), stream=out).sort_stats(sort).print_stats(limit)
+    return out.getvalue()
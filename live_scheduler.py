@@ -1,41 +1,255 @@
 # live_scheduler.py — Backend utility for process fetching and scheduling simulation
+import heapq
+import threading
+import time
+
+import numpy as np
 import psutil
-import random
 
-def get_live_processes(limit=10):
-    """Collect a sample of running system processes"""
-    processes = []
-    for proc in psutil.process_iter(['pid', 'name', 'cpu_percent']):
-        try:
-            info = proc.info
-            processes.append({
-                "pid": info['pid'],
-                "name": info['name'],
-                "arrival": random.randint(0, 10),
-                "burst": random.randint(1, 5)
+import diagnostics
+from simulation.schedule import ScheduleLog
+from simulation.xai import Reason
+
+_GONE = (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess)
+
+
+class ProcessSampler:
+    """Background thread that keeps a rolling, incrementally updated process snapshot.
+
+    psutil.Process handles are reused between samples, so only new pids pay
+    for construction and name/create_time lookups. Readers get the latest
+    snapshot without blocking; if it is older than `ttl` (thread stopped or
+    stalled) the reader refreshes it synchronously. start() takes an
+    unpublished priming sample first, so no reader ever sees a snapshot
+    whose CPU deltas (and host CPU %) are still zero.
+    """
+
+    PRIME_SECONDS = 0.25
+
+    def __init__(self, interval=2.0, ttl=10.0):
+        self.interval, self.ttl = interval, ttl
+        self._lock = threading.Lock()          # guards the published snapshot
+        self._sample_lock = threading.Lock()   # serialises sample_once between thread and readers
+        self._stop = threading.Event()
+        self._thread = None
+        self._procs = {}      # pid -> (psutil.Process, name, create_time)
+        self._prev_cpu = {}   # pid -> cumulative user+system seconds at the last sample
+        self._prev_ts = None
+        self._snapshot, self._system, self._stamp = [], {"cpu": 0.0, "mem": 0.0}, 0.0
+
+    # ---------- lifecycle ----------
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            if not self._stamp:
+                # priming sample: CPU-time baselines and psutil's cpu_percent reference point,
+                # so the first published snapshot already carries real deltas
+                with self._sample_lock:
+                    self._sample(publish=False)
+                time.sleep(self.PRIME_SECONDS)
+            self.sample_once()
+            self._thread = threading.Thread(target=self._run, name="process-sampler", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.sample_once()
+            except Exception:
+                pass
+
+    # ---------- sampling ----------
+    def sample_once(self):
+        with self._sample_lock, diagnostics.span("sampler.sample"):
+            self._sample()
+
+    def _sample(self, publish=True):
+        now = time.time()
+        pids = set(psutil.pids())
+        for pid in self._procs.keys() - pids:
+            self._procs.pop(pid, None); self._prev_cpu.pop(pid, None)
+        for pid in pids - self._procs.keys():
+            try:
+                proc = psutil.Process(pid)
+                self._procs[pid] = (proc, proc.name(), proc.create_time())
+            except _GONE:
+                continue
+
+        elapsed = (now - self._prev_ts) if self._prev_ts else 0.0
+        rows, gone = [], []
+        for pid, (proc, name, created) in self._procs.items():
+            try:
+                ct = proc.cpu_times()
+            except _GONE:
+                gone.append(pid)
+                continue
+            total = ct.user + ct.system
+            delta = max(total - self._prev_cpu.get(pid, total), 0.0)
+            self._prev_cpu[pid] = total
+            rows.append({
+                "pid": pid,
+                "name": name,
+                "arrival": created,
+                "burst": delta,
+                "cpu_time": total,
+                "cpu_percent": 100.0 * delta / elapsed if elapsed > 0 else 0.0,
             })
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-            continue
-        if len(processes) >= limit:
-            break
-    return processes
-
-def simulate_scheduler(processes, algo="fcfs"):
-    """Simulate CPU scheduling based on algorithm"""
-    schedule = []
-    time = 0
-    for p in processes:
-        start = time
-        finish = start + p['burst']
-        waiting = random.uniform(0.2, 3.0)
-        turnaround = waiting + p['burst']
-        schedule.append({
-            "pid": p['pid'],
-            "name": p['name'],
-            "start": start,
-            "finish": finish,
-            "waiting": waiting,
-            "turnaround": turnaround
-        })
-        time = finish
-    return schedule
+        for pid in gone:
+            self._procs.pop(pid, None); self._prev_cpu.pop(pid, None)
+        system = {"cpu": psutil.cpu_percent(interval=None), "mem": psutil.virtual_memory().percent}
+        if publish:
+            with self._lock:
+                self._snapshot, self._system, self._stamp = rows, system, now
+        self._prev_ts = now
+
+    # ---------- readers ----------
+    def age(self):
+        return time.time() - self._stamp
+
+    def stamp(self):
+        """Wall-clock time of the latest published sample (changes once per interval)"""
+        return self._stamp
+
+    def snapshot(self):
+        """Latest process rows (shared list — treat as read-only)"""
+        if self.age() > self.ttl:
+            self.sample_once()
+        with self._lock:
+            return self._snapshot
+
+    def system(self):
+        """Latest host CPU % and memory %"""
+        if self.age() > self.ttl:
+            self.sample_once()
+        with self._lock:
+            return dict(self._system)
+
+
+_sampler = None
+_sampler_lock = threading.Lock()
+
+
+def get_sampler(interval=2.0, ttl=10.0):
+    """Process-wide sampler shared by every dashboard session"""
+    global _sampler
+    with _sampler_lock:
+        if _sampler is None:
+            _sampler = ProcessSampler(interval=interval, ttl=ttl)
+        return _sampler.start()
+
+
+def system_stats():
+    """Non-blocking host CPU/memory percentages from the shared sampler"""
+    return get_sampler().system()
+
+
+def get_live_processes(limit=10):
+    """Return the `limit` busiest processes from the shared snapshot (burst = CPU seconds in the last interval)"""
+    rows = get_sampler().snapshot()
+    if limit is None or len(rows) <= limit:
+        return list(rows)
+    return heapq.nlargest(limit, rows, key=lambda r: r["burst"])
+
+
+# ---------------- Scheduling over a snapshot ----------------
+# The snapshot is one batch that is ready at the sampling instant: every
+# process arrives at t=0 and asks for the CPU seconds it actually used over
+# the last interval. FCFS/RR queue in create_time order; with simultaneous
+# arrivals SRTF never preempts, so it reduces to SJF.
+LIVE_ALGOS = ("fcfs", "sjf", "rr", "srtf")
+
+_REASONS = {"fcfs": Reason.EARLIEST_ARRIVAL.value, "sjf": Reason.SHORTEST_BURST.value,
+            "rr": Reason.RR_QUEUE_ORDER.value, "srtf": Reason.SHORTEST_REMAINING.value}
+
+
+def _batch_columns(processes):
+    n = len(processes)
+    pid = np.array([p['pid'] for p in processes], dtype=object)
+    name = np.array([p.get('name', '') for p in processes], dtype=object)
+    created = np.fromiter((p.get('arrival', 0) for p in processes), dtype=np.float64, count=n)
+    burst = np.fromiter((p['burst'] for p in processes), dtype=np.float64, count=n)
+    return pid, name, created, burst
+
+
+def _run_to_completion(order, burst):
+    finish = np.cumsum(burst[order])
+    return order, np.zeros(len(order)), finish - burst[order], finish
+
+
+def _round_robin(order, burst, quantum):
+    """Round-by-round RR; each round is one vectorized pass over the still-active queue"""
+    rem = burst.astype(np.float64).copy()
+    ready = np.zeros(len(burst))
+    idx_parts, ready_parts, start_parts, finish_parts, before_parts, count_parts = [], [], [], [], [], []
+    active, now = order, 0.0
+    while active.size:
+        before = rem[active]
+        run = np.minimum(before, quantum)
+        finish = now + np.cumsum(run)
+        # each slice starts exactly where the previous one finished; finish - run would
+        # round below `now` and give slightly negative waits
+        start = np.concatenate(([now], finish[:-1]))
+        rem[active] = before - run
+        done = rem[active] <= 1e-12
+        idx_parts.append(active); ready_parts.append(ready[active].copy())
+        start_parts.append(start); finish_parts.append(finish); before_parts.append(before)
+        count_parts.append(active.size - np.concatenate(([0], np.cumsum(done)[:-1])))
+        ready[active] = finish
+        now = finish[-1]
+        active = active[~done]
+    cat = lambda parts: np.concatenate(parts) if parts else np.zeros(0)
+    return (cat(idx_parts).astype(np.int64), cat(ready_parts), cat(start_parts), cat(finish_parts),
+            cat(before_parts), cat(count_parts))
+
+
+def simulate_scheduler(processes, algo="fcfs", quantum=0.01, explain=True):
+    """Schedule a snapshot batch with a real FCFS / SJF / RR / SRTF policy.
+
+    Returns (ScheduleLog, decisions); decisions carry the same fields as the
+    offline *_xai_decisions.csv files (empty when `explain` is False).
+    `quantum` is in CPU seconds (RR only).
+    """
+    if algo not in LIVE_ALGOS:
+        raise ValueError(f"unsupported algorithm: {algo}")
+    pid, name, created, burst = _batch_columns(processes)
+    if algo in ("fcfs", "rr"):
+        order = np.argsort(created, kind="stable")
+    else:
+        order = np.lexsort((created, burst))
+
+    if algo == "rr":
+        idx, ready, start, finish, before, ready_count = _round_robin(order, burst, quantum)
+    else:
+        idx, ready, start, finish = _run_to_completion(order, burst)
+        before, ready_count = burst[idx], len(idx) - np.arange(len(idx))
+    sched = ScheduleLog(idx, pid, ready, burst[idx], start, finish, attrs={"name": name})
+    if not explain:
+        return sched, []
+    return sched, _decisions(algo, pid[idx], created[idx], ready, burst[idx], start, before, finish - start, ready_count)
+
+
+def _decisions(algo, chosen, created, ready, burst, start, before, run, ready_count):
+    after = before - run
+    label, code = algo.upper(), _REASONS[algo]
+    rows = zip(chosen.tolist(), created.tolist(), ready.tolist(), burst.tolist(), start.tolist(), before.tolist(),
+               run.tolist(), after.tolist(), ready_count.tolist())
+    out = []
+    for pid, born, arr, bur, now, rem_before, ran, rem_after, count in rows:
+        d = {"algo": label, "time": now, "pid_chosen": pid, "arrival": arr, "burst": bur, "ready_count": int(count),
+             "reason_code": code}
+        if algo == "rr":
+            d.update({"quantum_used": ran, "remaining_after": rem_after, "queue_position": 1,
+                      "remaining_before": rem_before})
+        elif algo == "fcfs":
+            d.update({"arrival_of_chosen": born, "min_arrival_ready": born})
+        elif algo == "sjf":
+            d.update({"burst_of_chosen": bur, "min_burst_ready": bur})
+        else:
+            d.update({"priority": 0, "remaining_before": rem_before, "min_remaining_ready": rem_before})
+        d["now"] = now
+        out.append(d)
+    return out
@@ -1,78 +1,181 @@
 # main.py
-from simulation.cpu_scheduler import fcfs_scheduler, sjf_scheduler, round_robin_scheduler, draw_gantt_chart
-import pandas as pd
+from simulation.cpu_scheduler import SCHEDULERS, algo_label, run_algorithm, draw_gantt_chart
+from simulation.sweep import build_grid, parse_ints, run_sweep
+from simulation.workload import load_workload
+from simulation.run_store import RunStore
+from simulation.xai import sample, with_reasons
+from simulation.smp import BALANCERS, SMP_ALGOS, smp_schedule
+from simulation import bench
 import argparse
 import os
+from itertools import islice
 
 # ---------------- Argument Parser ----------------
 parser = argparse.ArgumentParser(description="CPU Scheduling Simulator")
-parser.add_argument("--algo", choices=["fcfs", "sjf", "rr"], required=True, help="Choose scheduling algorithm")
+parser.add_argument("mode", nargs="?", choices=["run", "sweep", "bench", "serve"], default="run",
+                    help="run: one algorithm on the demo processes; sweep: batch grid over a process pool; "
+                         "bench: throughput / latency / RSS benchmarks; serve: live metrics endpoint")
+parser.add_argument("--algo", choices=sorted(SCHEDULERS), help="Choose scheduling algorithm (run mode)")
 parser.add_argument("--quantum", type=int, default=2, help="Time quantum for Round Robin")
-args = parser.parse_args()
-
-# ---------------- Input Processes ----------------
-processes = [
-    {'pid': 'P1', 'arrival': 0, 'burst': 5},
-    {'pid': 'P2', 'arrival': 2, 'burst': 3},
-    {'pid': 'P3', 'arrival': 4, 'burst': 1}
-]
-
-# ---------------- Run Algorithm ----------------
-if args.algo == "fcfs":
-    schedule_log, decisions = fcfs_scheduler(processes.copy())
-    label = "FCFS"
-elif args.algo == "sjf":
-    schedule_log, decisions = sjf_scheduler(processes.copy())
-    label = "SJF"
-elif args.algo == "rr":
-    schedule_log, decisions = round_robin_scheduler(processes.copy(), quantum=args.quantum)
-    label = f"Round Robin (q={args.quantum})"
-else:
-    raise ValueError("Unsupported algorithm")
-
-# ---------------- Performance Metrics ----------------
-avg_wait = sum(p['waiting'] for p in schedule_log) / len(schedule_log)
-avg_turnaround = sum(p['turnaround'] for p in schedule_log) / len(schedule_log)
-
-# CPU Utilization & Throughput
-total_burst = sum(p['burst'] for p in schedule_log)
-total_time = max(p['finish'] for p in schedule_log)
-cpu_utilization = (total_burst / total_time) * 100
-throughput = len(schedule_log) / total_time
-
-print(f"\n🔹 {label} Results:")
-for entry in schedule_log:
-    print(f"{entry['pid']} → Start: {entry['start']}, Finish: {entry['finish']}, Waiting: {entry['waiting']}, Turnaround: {entry['turnaround']}")
-
-print("\n📊 Averages & Metrics:")
-print(f"Average Waiting Time: {avg_wait:.2f}")
-print(f"Average Turnaround Time: {avg_turnaround:.2f}")
-print(f"CPU Utilization: {cpu_utilization:.2f}%")
-print(f"Throughput: {throughput:.2f} processes/unit time")
-
-# ---------------- Save Logs ----------------
-df_log = pd.DataFrame(schedule_log)
-df_log.to_csv(f"{args.algo}_log.csv", index=False)
-
-df_decisions = pd.DataFrame(decisions)
-df_decisions.to_csv(f"{args.algo}_xai_decisions.csv", index=False)
-
-# ---------------- Save Performance Summary ----------------
-summary_file = "performance_summary.csv"
-summary_data = {
-    "Algorithm": [label],
-    "Average Waiting Time": [avg_wait],
-    "Average Turnaround Time": [avg_turnaround],
-    "CPU Utilization (%)": [cpu_utilization],
-    "Throughput": [throughput]
-}
-
-df_summary = pd.DataFrame(summary_data)
-if os.path.exists(summary_file):
-    old_df = pd.read_csv(summary_file)
-    df_summary = pd.concat([old_df, df_summary], ignore_index=True)
-df_summary.to_csv(summary_file, index=False)
-print(f"\n✅ Performance summary saved to {summary_file}")
-
-# ---------------- Optional Gantt Chart ----------------
-draw_gantt_chart(schedule_log, title=f"{label} Scheduling Gantt Chart")
+parser.add_argument("--workload", default="default",
+                    help="'default', 'random:<n>', '<arrival>-<burst>:<n>' (e.g. bursty-pareto:100000) or a CSV/Parquet trace")
+parser.add_argument("--seed", type=int, default=0, help="Seed for synthetic workloads (run mode)")
+parser.add_argument("--print-rows", type=int, default=50,
+                    help="Schedule slices printed in run mode (the full log is in the run store)")
+parser.add_argument("--store", default="runs", help="Run store directory (Parquet per run + manifest.jsonl)")
+parser.add_argument("--export-csv", action="store_true", help="Also write legacy {algo}_log.csv / {algo}_xai_decisions.csv")
+parser.add_argument("--xai-every", type=int, default=1, help="Keep every Nth scheduling decision in the XAI log")
+parser.add_argument("--xai-contested", action="store_true",
+                    help="Only log decisions with more than one ready candidate")
+parser.add_argument("--cores", type=int, default=1, help="Simulated CPUs; >1 runs the SMP model (fcfs/sjf/rr)")
+parser.add_argument("--balance", choices=BALANCERS, default="steal", help="SMP load balancing")
+parser.add_argument("--balance-interval", type=float, default=10.0, help="Time units between periodic rebalances")
+sweep_args = parser.add_argument_group("sweep mode")
+sweep_args.add_argument("--algos", nargs="+", choices=sorted(SCHEDULERS), default=["fcfs", "sjf", "rr"])
+sweep_args.add_argument("--quanta", nargs="+", default=["2"], help="RR quanta, e.g. 1-50 or 1,2,4")
+sweep_args.add_argument("--workloads", nargs="+", default=["default"],
+                        help="Workload specs as for --workload; trace files are streamed in chunks")
+sweep_args.add_argument("--seeds", nargs="+", default=["0"], help="Seeds for synthetic workloads, e.g. 0-9")
+sweep_args.add_argument("--workers", type=int, default=None, help="Pool size (default: all cores)")
+sweep_args.add_argument("--out", default="sweep_summary.csv", help="Summary table written by the sweep")
+bench_args = parser.add_argument_group("bench mode")
+bench_args.add_argument("--kinds", nargs="+", choices=bench.KINDS, default=list(bench.KINDS))
+bench_args.add_argument("--sizes", nargs="+", default=[str(n) for n in bench.DEFAULT_SIZES],
+                        help="Events per case, e.g. 1e3 1e5 1e7")
+bench_args.add_argument("--bench-out", default="bench_results.json", help="JSON results file")
+bench_args.add_argument("--baseline", help="Earlier results JSON to compare against (exit 1 on regression)")
+bench_args.add_argument("--tolerance", type=float, default=0.10, help="Allowed slowdown / p99 growth vs baseline")
+bench_args.add_argument("--no-isolate", action="store_true", help="Run cases in this process (peak RSS is cumulative)")
+serve_args = parser.add_argument_group("serve mode")
+serve_args.add_argument("--host", default="127.0.0.1", help="Bind address for /metrics and /metrics.json")
+serve_args.add_argument("--port", type=int, default=9108)
+serve_args.add_argument("--unix-socket", help="Serve on this Unix socket path instead of TCP")
+serve_args.add_argument("--sample-interval", type=float, default=2.0, help="Seconds between process snapshots")
+serve_args.add_argument("--limit", type=int, default=12, help="Busiest processes scheduled per snapshot")
+serve_args.add_argument("--contamination", type=float, default=0.2, help="Anomaly model contamination")
+
+
+def run_single(args):
+    # ---------------- Input Processes ----------------
+    try:
+        processes = load_workload(args.workload, seed=args.seed)
+    except ValueError as e:
+        parser.error(str(e))
+
+    # ---------------- Run Algorithm ----------------
+    # Decisions stream straight into the run's Parquet file (sampled if requested)
+    store = RunStore(args.store)
+    run_id = store.new_run()
+    smp = None
+    with store.decision_writer(run_id) as writer:
+        if args.cores > 1:  # per-core run queues; no per-decision XAI log
+            schedule_log, smp = smp_schedule(processes, cores=args.cores, algo=args.algo, quantum=args.quantum,
+                                             balance=args.balance, balance_interval=args.balance_interval)
+        else:
+            sink = sample(writer, every=args.xai_every, contested_only=args.xai_contested)
+            schedule_log, _ = run_algorithm(args.algo, processes, quantum=args.quantum, decisions=sink)
+    label = algo_label(args.algo, args.quantum)
+    if smp is not None:
+        label = f"{label} × {args.cores} cores ({args.balance})"
+
+    # ---------------- Performance Metrics ----------------
+    # Vectorized over the columnar log; RR slices are aggregated per process
+    metrics = schedule_log.metrics()
+    avg_wait = metrics['avg_wait']
+    avg_turnaround = metrics['avg_tat']
+
+    # CPU Utilization & Throughput
+    cpu_utilization = metrics.get('cpu_util', float('nan'))  # absent when every burst is zero
+    throughput = metrics.get('throughput', float('nan'))
+
+    print(f"\n🔹 {label} Results:")
+    for entry in islice(schedule_log, args.print_rows):
+        print(f"{entry['pid']} → Start: {entry['start']}, Finish: {entry['finish']}, Waiting: {entry['waiting']}, Turnaround: {entry['turnaround']}")
+    if len(schedule_log) > args.print_rows:
+        print(f"… {len(schedule_log) - args.print_rows:,} more slices (raise --print-rows, or see the run store)")
+
+    print("\n📊 Averages & Metrics:")
+    print(f"Average Waiting Time: {avg_wait:.2f}")
+    print(f"Average Turnaround Time: {avg_turnaround:.2f}")
+    print(f"CPU Utilization: {cpu_utilization:.2f}%")
+    print(f"Throughput: {throughput:.2f} processes/unit time")
+    if smp is not None:
+        metrics.update(makespan=smp["makespan"], migrations=smp["migrations"], imbalance=smp["imbalance"])
+        print(f"Makespan: {smp['makespan']:.2f}  Migrations: {smp['migrations']} (steals: {smp['steals']})  "
+              f"Busiest/mean core load: {smp['imbalance']:.3f}")
+        print("Per-core utilization: " + ", ".join(f"cpu{c}={u:.1f}%" for c, u in enumerate(smp["utilization"])))
+
+    # ---------------- Save Run ----------------
+    params = {"algo": args.algo, "quantum": args.quantum if args.algo == "rr" else None,
+              "workload": args.workload, "seed": args.seed, "xai_every": args.xai_every,
+              "xai_contested": args.xai_contested, "cores": args.cores,
+              "balance": args.balance if args.cores > 1 else None}
+    store.save_run(schedule_log, None, label, params=params, metrics=metrics, run_id=run_id)
+    print(f"\n✅ Run {run_id} saved to {store.root}/ ({writer.count} decisions logged; manifest: {store.manifest})")
+
+    # ---------------- Optional CSV Export ----------------
+    if args.export_csv:
+        schedule_log.to_pandas().to_csv(f"{args.algo}_log.csv", index=False)
+        with_reasons(store.load(run_id, "decisions")).to_csv(f"{args.algo}_xai_decisions.csv", index=False)
+
+    # ---------------- Optional Gantt Chart ----------------
+    draw_gantt_chart(schedule_log, title=f"{label} Scheduling Gantt Chart")
+
+
+def run_sweep_cli(args):
+    try:
+        points = build_grid(args.algos, parse_ints(args.quanta), args.workloads, parse_ints(args.seeds))
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"🔹 Sweeping {len(points)} runs across {args.workers or os.cpu_count()} workers…")
+    for n, row in enumerate(run_sweep(points, out_path=args.out, workers=args.workers), 1):
+        print(f"[{n}/{len(points)}] {row['Algorithm']:<22} {row['workload']} seed={row['seed']} "
+              f"wait={row['Average Waiting Time']:.2f} tat={row['Average Turnaround Time']:.2f}")
+    print(f"\n✅ Sweep summary saved to {args.out}")
+
+
+def run_bench_cli(args):
+    cases = bench.build_cases(args.kinds, [int(float(s)) for s in args.sizes])
+    print(f"🔹 Benchmarking {len(cases)} cases…")
+    rows = []
+    for row in bench.run_bench(cases, seed=args.seed, isolate=not args.no_isolate):
+        rows.append(row)
+        lat = f"p50={row['p50_us']:.2f}µs p99={row['p99_us']:.2f}µs" if row['p99_us'] is not None else "latency n/a"
+        print(f"{row['kind']:<7} {row['algo']:<9} n={row['n']:<9} {row['events_per_s']:>14,.0f} ev/s  "
+              f"{lat}  peak RSS {row['peak_rss_mb']:.0f} MB")
+    bench.save_results(rows, args.bench_out, seed=args.seed)
+    print(f"\n✅ Results saved to {args.bench_out}")
+
+    if args.baseline:
+        diff = bench.compare(bench.load_results(args.bench_out), bench.load_results(args.baseline), args.tolerance)
+        print(f"\n📊 Against {args.baseline}:")
+        for d in diff:
+            p99 = f"{d['p99_ratio']:.2f}x" if d['p99_ratio'] is not None else "–"
+            print(f"{'❌' if d['regressed'] else '✅'} {d['kind']:<7} {d['algo']:<9} n={d['n']:<9} "
+                  f"throughput {d['speedup']:.2f}x  p99 {p99}")
+        if any(d["regressed"] for d in diff):
+            raise SystemExit(1)
+
+
+def run_serve_cli(args):
+    import metrics_server  # psutil + live sampler only when serving
+    where = args.unix_socket or f"http://{args.host}:{args.port}"
+    print(f"🔹 Serving live scheduler metrics on {where} (/metrics, /metrics.json) — Ctrl+C to stop")
+    metrics_server.serve(args.host, args.port, args.unix_socket, interval=args.sample_interval, limit=args.limit,
+                         contamination=args.contamination)
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    if args.mode == "sweep":
+        run_sweep_cli(args)
+    elif args.mode == "bench":
+        run_bench_cli(args)
+    elif args.mode == "serve":
+        run_serve_cli(args)
+    elif args.algo is None:
+        parser.error("--algo is required in run mode")
+    elif args.cores > 1 and args.algo not in SMP_ALGOS:
+        parser.error(f"--cores > 1 supports {', '.join(SMP_ALGOS)}")
+    else:
+        run_single(args)
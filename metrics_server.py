@@ -0,0 +1,186 @@
+# metrics_server.py — Headless live-scheduler metrics over HTTP / Unix socket: Prometheus text + JSON (UI-free)
+import heapq
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import live_scheduler
+from anomaly_detector import AnomalyService  # sklearn loads on the first fit
+from simulation.schedule import perf_from_schedule
+
+PROM_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+JSON_CONTENT_TYPE = "application/json"
+
+# perf_from_schedule key -> (metric name, help) for the per-algorithm gauges
+KPI_METRICS = {
+    "avg_wait": ("xai_sched_avg_wait_seconds", "Average waiting time of the simulated schedule"),
+    "avg_tat": ("xai_sched_avg_turnaround_seconds", "Average turnaround time of the simulated schedule"),
+    "throughput": ("xai_sched_throughput", "Processes completed per CPU second in the simulated schedule"),
+    "cpu_util": ("xai_sched_cpu_utilization_percent", "CPU utilization of the simulated schedule (%)"),
+}
+
+
+class MetricsCollector:
+    """Turns the shared sampler's latest snapshot into KPIs and anomaly counts, once per snapshot.
+
+    Every algorithm in `algos` schedules the `limit` busiest processes,
+    exactly as the dashboard's live tab does, and each keeps its own
+    AnomalyService over (waiting, turnaround). Results and both rendered
+    formats are cached until the sampler publishes a new snapshot, so any
+    number of clients can poll without extra psutil scans or model work.
+    """
+
+    def __init__(self, sampler=None, algos=live_scheduler.LIVE_ALGOS, limit=12,
+                 features=("waiting", "turnaround"), contamination=0.2):
+        self.sampler = sampler or live_scheduler.get_sampler()
+        self.algos, self.limit, self.features = tuple(algos), limit, list(features)
+        self._anomaly = {a: AnomalyService(self.features, contamination=contamination) for a in self.algos}
+        self._lock = threading.Lock()
+        self._cache = None   # {"stamp", "data", "json", "prom"}
+        self.collections = 0
+
+    def latest(self):
+        """Cached {"stamp", "data", "json", "prom"} for the current snapshot (recomputed on the first request after a new one)"""
+        with self._lock:
+            stamp = self.sampler.stamp()
+            if self._cache is None or self._cache["stamp"] != stamp:
+                data = self._collect()
+                self._cache = {"stamp": data["stamp"], "data": data,
+                               "json": json.dumps(data).encode("utf-8"), "prom": prometheus_text(data).encode("utf-8")}
+            return self._cache
+
+    def _collect(self):
+        all_procs = self.sampler.snapshot()     # refreshes synchronously if the sampler has stalled
+        stamp = self.sampler.stamp()
+        # same selection as get_live_processes(), but from this collector's own sampler
+        procs = heapq.nlargest(self.limit, all_procs, key=lambda r: r["burst"])
+        algos = {}
+        for algo in self.algos:
+            sched, _ = live_scheduler.simulate_scheduler(procs, algo=algo, explain=False)
+            kpis = perf_from_schedule(sched)
+            service, flagged = self._anomaly[algo], 0
+            if len(sched):
+                try:
+                    labels, _ = service.update(sched.to_pandas(), stamp=stamp)
+                    flagged = int((labels == "Anomaly").sum())
+                except Exception:
+                    pass
+            algos[algo] = {**{k: float(v) for k, v in kpis.items()}, "slices": len(sched),
+                           "anomalies": flagged, "anomaly_fits": service.fits}
+        self.collections += 1
+        return {
+            "stamp": stamp,
+            "collected": time.time(),
+            "system": self.sampler.system(),
+            "processes": len(all_procs),
+            "scheduled": len(procs),
+            "top": [{k: p[k] for k in ("pid", "name", "burst", "cpu_percent")} for p in procs],
+            "algos": algos,
+            "collections": self.collections,
+        }
+
+
+# ---------------- Prometheus text ----------------
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def prometheus_text(data):
+    """Prometheus text exposition (format 0.0.4) of one collected snapshot"""
+    lines = []
+
+    def metric(name, kind, help_txt, samples):
+        lines.append(f"# HELP {name} {help_txt}")
+        lines.append(f"# TYPE {name} {kind}")
+        for labels, value in samples:
+            tags = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+            lines.append(f"{name}{{{tags}}} {float(value)!r}" if tags else f"{name} {float(value)!r}")
+
+    algos = data["algos"]
+    metric("xai_system_cpu_percent", "gauge", "Host CPU utilization (%)", [({}, data["system"]["cpu"])])
+    metric("xai_system_memory_percent", "gauge", "Host memory utilization (%)", [({}, data["system"]["mem"])])
+    metric("xai_sample_timestamp_seconds", "gauge", "Wall-clock time of the process snapshot", [({}, data["stamp"])])
+    metric("xai_processes", "gauge", "Processes in the latest snapshot", [({}, data["processes"])])
+    metric("xai_scheduled_processes", "gauge", "Busiest processes fed to each scheduler", [({}, data["scheduled"])])
+    for key, (name, help_txt) in KPI_METRICS.items():
+        metric(name, "gauge", help_txt, [({"algo": a}, v[key]) for a, v in algos.items() if key in v])
+    metric("xai_anomalies", "gauge", "Slices flagged by the anomaly model in the latest snapshot",
+           [({"algo": a}, v["anomalies"]) for a, v in algos.items()])
+    metric("xai_anomaly_model_fits_total", "counter", "IsolationForest refits",
+           [({"algo": a}, v["anomaly_fits"]) for a, v in algos.items()])
+    metric("xai_collections_total", "counter", "Snapshots turned into metrics (one per sampler stamp)",
+           [({}, data["collections"])])
+    return "\n".join(lines) + "\n"
+
+
+# ---------------- HTTP ----------------
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "xai-metrics/1.0"
+    routes = {"/metrics": ("prom", PROM_CONTENT_TYPE), "/metrics.json": ("json", JSON_CONTENT_TYPE)}
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == "/healthz":
+            return self._send(200, b"ok\n", "text/plain; charset=utf-8")
+        if path not in self.routes:
+            return self._send(404, b"not found: try /metrics or /metrics.json\n", "text/plain; charset=utf-8")
+        fmt, ctype = self.routes[path]
+        try:
+            body = self.server.collector.latest()[fmt]
+        except Exception as e:
+            return self._send(500, f"collection failed: {e}\n".encode("utf-8"), "text/plain; charset=utf-8")
+        self._send(200, body, ctype)
+
+    def _send(self, code, body, ctype):
+        self.send_response(code)
+        self.send_header("Content-Type", ctype)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # scrapers poll every few seconds; keep stderr quiet
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, getattr(socketserver, "UnixStreamServer", object)):
+    daemon_threads = True
+
+    def get_request(self):
+        conn, _ = super().get_request()
+        return conn, ("unix", 0)  # BaseHTTPRequestHandler expects a (host, port) pair
+
+
+def make_server(collector=None, host="127.0.0.1", port=9108, unix_socket=None):
+    """HTTP server on host:port, or on a Unix socket path when `unix_socket` is given (call serve_forever())"""
+    collector = collector or MetricsCollector()
+    if unix_socket:
+        if not hasattr(socket, "AF_UNIX"):
+            raise RuntimeError("Unix sockets are not available on this platform")
+        if os.path.exists(unix_socket):
+            os.unlink(unix_socket)  # stale socket from an earlier run
+        server = _UnixHTTPServer(unix_socket, _Handler)
+    else:
+        server = ThreadingHTTPServer((host, port), _Handler)
+        server.daemon_threads = True
+    server.collector = collector
+    return server
+
+
+def serve(host="127.0.0.1", port=9108, unix_socket=None, interval=2.0, limit=12, contamination=0.2):
+    """Run the endpoint until interrupted"""
+    collector = MetricsCollector(live_scheduler.get_sampler(interval=interval), limit=limit,
+                                 contamination=contamination)
+    server = make_server(collector, host, port, unix_socket)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if unix_socket and os.path.exists(unix_socket):
+            os.unlink(unix_socket)
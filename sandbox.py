@@ -0,0 +1,264 @@
+# sandbox.py — Pool of warm, single-use Python subprocesses for running untrusted snippets (UI-free)
+import json
+import os
+import queue
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+_SIGXCPU = getattr(signal, "SIGXCPU", None)  # POSIX only
+_MEMORY_EXIT = 99         # worker exit code for a MemoryError (the address-space limit was hit)
+_PIPE_SLACK = 4096        # room past max_output for the worker's truncation note
+_THREAD_CAPS = {"OPENBLAS_NUM_THREADS": "1", "OMP_NUM_THREADS": "1", "MKL_NUM_THREADS": "1"}
+
+# Runs inside the worker: block on one job, apply limits, exec, exit.
+_WORKER = r"""
+import json, os, sys, traceback
+job = json.loads(sys.stdin.readline())
+sys.stdin.close()
+try:
+    import resource
+    if job["cpu"]:
+        resource.setrlimit(resource.RLIMIT_CPU, (job["cpu"], job["cpu"] + 1))
+    if job["mem"]:
+        # Linux ignores RLIMIT_RSS, so cap the address space instead
+        resource.setrlimit(resource.RLIMIT_AS, (job["mem"], job["mem"]))
+except ImportError:  # Windows: wall-clock timeout only
+    pass
+
+class _Capped:
+    def __init__(self, stream, limit):
+        self.stream, self.left = stream, limit
+    def write(self, s):
+        if self.left > 0:
+            self.stream.write(s[:self.left])
+            if len(s) > self.left:
+                self.stream.write("\n… output truncated\n")
+            self.left -= len(s)
+        return len(s)
+    def flush(self):
+        self.stream.flush()
+
+sys.stdout = _Capped(sys.stdout, job["max_output"])
+try:
+    exec(compile(job["code"], "<sandbox>", "exec"), {"__name__": "__main__"})
+except SystemExit:
+    raise
+except MemoryError:
+    sys.stdout.flush()
+    os.write(2, b"MemoryError: memory limit exceeded\n")
+    os._exit(99)
+except BaseException:
+    traceback.print_exc(limit=-20)
+    sys.exit(1)
+finally:
+    sys.stdout.flush()
+"""
+
+
+class SandboxPool:
+    """Runs code in pre-started Python subprocesses, each used for exactly one job.
+
+    `size` interpreters are kept booted and blocked on stdin, so a job only
+    pays for sending its code; a replacement is started as soon as one is
+    taken. Every job gets a fresh process and temp working directory, a
+    minimal environment (none of the server's variables), a CPU limit and
+    address-space limit (setrlimit, POSIX only) and a wall-clock timeout.
+    Each worker leads its own process group, which is killed when the job
+    ends, so children a snippet starts in the background die with it.
+    stdout and stderr are read through bounded buffers: a job that writes
+    more than `max_output` bytes to either is killed, so no snippet can make
+    the server hold its output in memory. Up to `size` jobs run in
+    parallel; the rest wait in the executor's queue.
+    """
+
+    def __init__(self, size=2, cpu_seconds=5, memory_mb=512, timeout=10.0, max_output=200_000):
+        self.size = size
+        self.cpu_seconds, self.memory_mb, self.timeout, self.max_output = cpu_seconds, memory_mb, timeout, max_output
+        self._idle = queue.Queue()
+        self._jobs = ThreadPoolExecutor(max_workers=size, thread_name_prefix="sandbox")
+        self._lock = threading.Lock()
+        self._warming = 0   # replacements being started in the background
+        self._closed = False
+        for _ in range(size):
+            self._idle.put(self._spawn())
+
+    # ---------- workers ----------
+    @staticmethod
+    def _spawn():
+        cwd = tempfile.mkdtemp(prefix="xai-sandbox-")
+        env = {"PATH": os.environ.get("PATH", os.defpath), "LANG": os.environ.get("LANG", "C.UTF-8"),
+               "PYTHONIOENCODING": "utf-8", **_THREAD_CAPS}
+        if os.name == "nt":
+            env["SYSTEMROOT"] = os.environ.get("SYSTEMROOT", "")  # the interpreter cannot start without it
+        proc = subprocess.Popen([sys.executable, "-I", "-u", "-c", _WORKER], cwd=cwd, env=env,
+                                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                start_new_session=True)
+        return proc, cwd
+
+    def _take(self):
+        try:
+            worker = self._idle.get_nowait()
+        except queue.Empty:
+            worker = self._spawn()  # cold start for this job; it never joins the idle pool
+        self._refill()
+        return worker
+
+    def _refill(self):
+        """Start one background replacement unless idle + starting workers already reach `size`"""
+        with self._lock:
+            if self._closed or self._idle.qsize() + self._warming >= self.size:
+                return
+            self._warming += 1
+        threading.Thread(target=self._warm, daemon=True).start()
+
+    def _warm(self):
+        try:
+            proc, cwd = self._spawn()
+            with self._lock:
+                if not self._closed:
+                    self._idle.put((proc, cwd))
+                    return
+            _kill(proc)
+            shutil.rmtree(cwd, ignore_errors=True)
+        finally:
+            with self._lock:
+                self._warming -= 1
+
+    # ---------- jobs ----------
+    def submit(self, code, cpu_seconds=None, memory_mb=None, timeout=None):
+        """Queue a job; returns a Future resolving to the result dict of run()"""
+        return self._jobs.submit(self._run, code, cpu_seconds, memory_mb, timeout)
+
+    def run(self, code, cpu_seconds=None, memory_mb=None, timeout=None):
+        """Run `code` and return {status, stdout, stderr, returncode, wall_s}.
+
+        status is "ok", "error" (exception / non-zero exit), "timeout",
+        "cpu_limit", "memory_limit", "output_limit" or "killed" (any other
+        signal).
+        """
+        return self.submit(code, cpu_seconds, memory_mb, timeout).result()
+
+    def _run(self, code, cpu_seconds, memory_mb, timeout):
+        cpu = cpu_seconds or self.cpu_seconds
+        mem = (memory_mb or self.memory_mb) * 2 ** 20
+        timeout = timeout or self.timeout
+        proc, cwd = self._take()
+        job = json.dumps({"code": code, "cpu": int(cpu), "mem": int(mem), "max_output": self.max_output})
+        t0 = time.perf_counter()
+        over = threading.Event()
+        limit = self.max_output + _PIPE_SLACK
+        readers = [_BoundedReader(proc.stdout, limit, over), _BoundedReader(proc.stderr, limit, over)]
+        status = None
+        try:
+            try:
+                proc.stdin.write((job + "\n").encode("utf-8"))
+                proc.stdin.close()
+            except BrokenPipeError:  # worker died before reading its job
+                pass
+            deadline = t0 + timeout
+            while True:
+                try:
+                    proc.wait(timeout=0.05)
+                    break
+                except subprocess.TimeoutExpired:
+                    if over.is_set():
+                        status = "output_limit"
+                    elif time.perf_counter() > deadline:
+                        status = "timeout"
+                    else:
+                        continue
+                    _kill(proc)
+                    break
+            _kill(proc)  # background children of a finished job still hold the pipes
+            for r in readers:
+                r.join(max(deadline - time.perf_counter(), 0.0) + 0.5)
+            if status is None and any(r.is_alive() for r in readers):
+                status = "timeout"   # a descendant left the process group and kept the pipes open
+        finally:
+            shutil.rmtree(cwd, ignore_errors=True)
+        rc = proc.returncode
+        if status is None:
+            if rc == 0:
+                status = "ok"
+            elif _SIGXCPU is not None and rc == -_SIGXCPU:
+                status = "cpu_limit"
+            elif rc == _MEMORY_EXIT:
+                status = "memory_limit"
+            elif rc < 0:
+                status = "killed"
+            else:
+                status = "error"
+        out, err = (r.text() for r in readers)
+        # the readers already hold at most max_output + _PIPE_SLACK bytes, which keeps the truncation note
+        return {"status": status, "stdout": out, "stderr": err,
+                "returncode": rc, "wall_s": time.perf_counter() - t0}
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+        self._jobs.shutdown(wait=False, cancel_futures=True)
+        while True:
+            try:
+                proc, cwd = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            _kill(proc)
+            shutil.rmtree(cwd, ignore_errors=True)
+
+
+def _kill(proc):
+    """SIGKILL the worker's whole process group (just the worker where there are no groups) and reap it"""
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except (AttributeError, ProcessLookupError, PermissionError):
+        if proc.poll() is None:
+            proc.kill()
+    proc.wait()
+
+
+class _BoundedReader(threading.Thread):
+    """Drains one child pipe, keeping at most `limit` bytes; sets `over` when more arrives.
+
+    Draining continues past the limit (bytes are dropped) so the child never
+    blocks on a full pipe before it is killed.
+    """
+
+    def __init__(self, stream, limit, over):
+        super().__init__(daemon=True)
+        self.stream, self.limit, self.over = stream, limit, over
+        self.buf = bytearray()
+        self.start()
+
+    def run(self):
+        with self.stream:
+            while True:
+                chunk = self.stream.read1(65_536)
+                if not chunk:
+                    break
+                room = self.limit - len(self.buf)
+                if len(chunk) > room:
+                    self.over.set()
+                if room > 0:
+                    self.buf += chunk[:room]
+
+    def text(self):
+        return self.buf.decode("utf-8", errors="replace")
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool(size=None):
+    """Process-wide pool shared by every dashboard session"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = SandboxPool(size=size or min(4, os.cpu_count() or 1))
+        return _pool
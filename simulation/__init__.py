@@ -0,0 +1 @@
+# simulation/ — UI-free simulators used by main.py and xai_dashboard.py
@@ -0,0 +1,160 @@
+# simulation/bench.py — Headless benchmarks (scheduling / paging / disk) with JSON results and baseline comparison
+import json
+import os
+import platform
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+import numpy as np
+
+from simulation import disk, paging
+from simulation.cpu_scheduler import SCHEDULERS, run_algorithm
+from simulation.workload import generate_workload, iter_processes
+
+KINDS = ("sched", "paging", "disk")
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+LATENCY_SAMPLES = 100_000   # cap on recorded per-decision latencies per case
+PAGING_FRAMES = 64
+DISK_MAX_CYL = 65_535
+
+
+# ---------------- Probes ----------------
+class LatencyProbe:
+    """Decision sink that keeps only timing: the gap between consecutive append() calls.
+
+    Stands in for the decision list, so the dicts are built (their cost is
+    measured) but not retained. Every `every`-th gap is recorded.
+    """
+
+    def __init__(self, every=1):
+        self.every, self.count = max(int(every), 1), 0
+        self.gaps = array('q')
+        self._last = time.perf_counter_ns()
+
+    def append(self, _):
+        now = time.perf_counter_ns()
+        if self.count % self.every == 0:
+            self.gaps.append(now - self._last)
+        self._last = now
+        self.count += 1
+
+    def wrap(self, iterable):
+        """Yield from `iterable`, recording the gap between items (per-reference latency for pull loops)"""
+        self._last = time.perf_counter_ns()
+        for item in iterable:
+            self.append(None)
+            yield item
+
+    def percentiles(self):
+        if not self.gaps:
+            return None, None
+        p50, p99 = np.percentile(np.frombuffer(self.gaps, dtype=np.int64), [50, 99])
+        return float(p50) / 1e3, float(p99) / 1e3  # microseconds
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process so far"""
+    try:
+        import resource
+    except ImportError:  # Windows
+        import psutil
+        return psutil.Process().memory_info().peak_wset / 2 ** 20
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2 ** 20 if sys.platform == "darwin" else peak / 2 ** 10  # bytes on macOS, KiB elsewhere
+
+
+# ---------------- Workloads ----------------
+def page_refs(n, pages=4096, seed=0):
+    """Reference string with locality: a Zipf-skewed working set that drifts every ~n/20 references"""
+    rng = np.random.default_rng(seed)
+    hot = (rng.zipf(1.3, n) - 1) % pages
+    drift = (np.arange(n) // max(n // 20, 1)) * (pages // 8)
+    return ((hot + drift) % pages).tolist()
+
+
+def disk_requests(n, seed=0):
+    return np.random.default_rng(seed).integers(0, DISK_MAX_CYL + 1, n)
+
+
+# ---------------- Cases ----------------
+def build_cases(kinds=KINDS, sizes=DEFAULT_SIZES):
+    """One case per (kind, algorithm, size)"""
+    algos = {"sched": sorted(SCHEDULERS), "paging": list(paging.POLICIES), "disk": list(disk.POLICIES)}
+    return [{"kind": kind, "algo": algo, "n": int(n)} for kind in kinds for algo in algos[kind] for n in sizes]
+
+
+def run_case(case, seed=0):
+    """Run one case and return its result row (executed in a fresh worker process)"""
+    kind, algo, n = case["kind"], case["algo"], case["n"]
+    probe = LatencyProbe(every=-(-n // LATENCY_SAMPLES))
+    base_rss = peak_rss_mb()
+    if kind == "sched":
+        cols = generate_workload(n, seed=seed)
+        t0 = time.perf_counter()
+        run_algorithm(algo, iter_processes(cols), quantum=2, decisions=probe)
+        seconds = time.perf_counter() - t0
+        events = probe.count
+    elif kind == "paging":
+        refs = page_refs(n, seed=seed)
+        # OPT needs the whole string up front, so per-reference gaps would only time list()
+        source = refs if algo == "OPT" else probe.wrap(refs)
+        t0 = time.perf_counter()
+        paging.simulate_paging(source, PAGING_FRAMES, algo, timeline=False)
+        seconds = time.perf_counter() - t0
+        events = n
+    elif kind == "disk":
+        reqs = disk_requests(n, seed=seed)
+        t0 = time.perf_counter()
+        disk.disk_schedule(reqs, DISK_MAX_CYL // 2, algo, "up", max_cyl=DISK_MAX_CYL)
+        seconds = time.perf_counter() - t0
+        events = n  # vectorised batch: no per-decision step to time
+    else:
+        raise ValueError(f"unknown benchmark kind: {kind}")
+    p50, p99 = probe.percentiles()
+    return {**case, "events": events, "seconds": seconds, "events_per_s": events / max(seconds, 1e-9),
+            "p50_us": p50, "p99_us": p99, "peak_rss_mb": peak_rss_mb(), "base_rss_mb": base_rss}
+
+
+def run_bench(cases, seed=0, isolate=True):
+    """Yield result rows; with `isolate` every case runs in its own spawned process so peak RSS is per case"""
+    for case in cases:
+        if not isolate:
+            yield run_case(case, seed)
+            continue
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+            yield pool.submit(run_case, case, seed).result()
+
+
+# ---------------- Results ----------------
+def environment():
+    return {"created": time.time(), "python": platform.python_version(), "platform": platform.platform(),
+            "machine": platform.machine(), "cpu_count": os.cpu_count(), "numpy": np.__version__}
+
+
+def save_results(rows, path, seed=0):
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump({"env": environment(), "seed": seed, "results": list(rows)}, fh, indent=2)
+
+
+def load_results(path):
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def compare(current, baseline, tolerance=0.10):
+    """Match rows on (kind, algo, n) and flag throughput drops or p99 growth beyond `tolerance`"""
+    base = {(r["kind"], r["algo"], r["n"]): r for r in baseline["results"]}
+    out = []
+    for r in current["results"]:
+        b = base.get((r["kind"], r["algo"], r["n"]))
+        if b is None:
+            continue
+        speed = r["events_per_s"] / max(b["events_per_s"], 1e-9)
+        p99 = r["p99_us"] / b["p99_us"] if r["p99_us"] and b["p99_us"] else None
+        regressed = speed < 1 - tolerance or (p99 is not None and p99 > 1 + tolerance)
+        out.append({"kind": r["kind"], "algo": r["algo"], "n": r["n"], "speedup": speed, "p99_ratio": p99,
+                    "regressed": regressed})
+    return out
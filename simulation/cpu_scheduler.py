@@ -0,0 +1,254 @@
+# simulation/cpu_scheduler.py — Event-driven CPU scheduling engine (FCFS / SJF / RR / SRTF / Priority)
+import heapq
+from array import array
+from collections import deque
+
+import numpy as np
+
+from simulation.schedule import ScheduleLog
+from simulation.xai import Reason
+
+
+# ---------------- Workload Admission ----------------
+class _Workload:
+    """Admits arrival-ordered processes lazily and keeps their attributes by index"""
+
+    def __init__(self, processes):
+        if isinstance(processes, (list, tuple)):
+            processes = sorted(processes, key=lambda p: p['arrival'])
+        self._it = iter(processes)
+        self._next = next(self._it, None)
+        self.pid, self.arrival, self.burst, self.priority = [], [], [], []
+
+    def next_arrival(self):
+        return None if self._next is None else self._next['arrival']
+
+    def admit(self, now):
+        """Return indices of the processes that have arrived by `now`"""
+        out = []
+        p = self._next
+        while p is not None and p['arrival'] <= now:
+            out.append(len(self.pid))
+            self.pid.append(p['pid'])
+            self.arrival.append(p['arrival'])
+            self.burst.append(p['burst'])
+            self.priority.append(p.get('priority', 0))
+            nxt = next(self._it, None)
+            if nxt is not None and nxt['arrival'] < p['arrival']:
+                raise ValueError("streamed processes must be sorted by arrival")
+            p = nxt
+        self._next = p
+        return out
+
+
+class _Slices:
+    """Append-only columns of executed slices: (index, ready, start, finish)"""
+
+    def __init__(self):
+        self.index, self.ready = array('i'), array('d')
+        self.start, self.finish = array('d'), array('d')
+
+    def add(self, i, ready, start, finish):
+        self.index.append(i); self.ready.append(ready)
+        self.start.append(start); self.finish.append(finish)
+
+    def build(self, w, **extra):
+        idx = np.frombuffer(self.index, dtype=np.intc) if len(self.index) else np.zeros(0, np.int32)
+        col = lambda a: np.frombuffer(a, dtype=np.float64) if len(a) else np.zeros(0)
+        burst = np.asarray(w.burst, dtype=np.float32)[idx] if len(idx) else np.zeros(0, np.float32)
+        return ScheduleLog(idx, w.pid, col(self.ready), burst, col(self.start), col(self.finish), **extra)
+
+
+# ---------------- Non-preemptive (FCFS / SJF) ----------------
+def _run_nonpreemptive(processes, key, explain, decisions=None):
+    w = _Workload(processes)
+    ready, rows = [], _Slices()
+    decisions = [] if decisions is None else decisions
+    want = getattr(decisions, "want", None)
+    now = 0
+    while True:
+        for i in w.admit(now):
+            heapq.heappush(ready, (key(w, i), i))
+        if not ready:
+            nxt = w.next_arrival()
+            if nxt is None:
+                break
+            now = max(now, nxt)
+            continue
+        k, i = heapq.heappop(ready)
+        if want is None or want(len(ready) + 1):
+            decisions.append(explain(w, i, now, len(ready) + 1, k))
+        finish = now + w.burst[i]
+        rows.add(i, w.arrival[i], now, finish)
+        now = finish
+    return rows.build(w), decisions
+
+
+def _explain_fcfs(w, i, now, ready_count, key):
+    return {
+        "algo": "FCFS", "time": now, "pid_chosen": w.pid[i], "arrival": w.arrival[i], "burst": w.burst[i],
+        "ready_count": ready_count, "reason_code": Reason.EARLIEST_ARRIVAL.value,
+        "arrival_of_chosen": w.arrival[i], "min_arrival_ready": w.arrival[i], "now": now
+    }
+
+
+def _explain_sjf(w, i, now, ready_count, key):
+    return {
+        "algo": "SJF", "time": now, "pid_chosen": w.pid[i], "arrival": w.arrival[i], "burst": w.burst[i],
+        "ready_count": ready_count, "reason_code": Reason.SHORTEST_BURST.value,
+        "burst_of_chosen": w.burst[i], "min_burst_ready": key[0], "now": now
+    }
+
+
+# Every scheduler takes an optional `decisions` sink: any object with
+# append() (a list by default) that receives each decision dict and is
+# returned in place of the list. If the sink has want(ready_count), the
+# dict is only built when it returns True (see simulation.xai.Sampled).
+def fcfs_scheduler(processes, decisions=None):
+    """First-Come-First-Served; the ready set is a heap keyed on arrival order"""
+    return _run_nonpreemptive(processes, lambda w, i: i, _explain_fcfs, decisions)
+
+
+def sjf_scheduler(processes, decisions=None):
+    """Non-preemptive Shortest-Job-First; the ready set is a heap keyed on burst"""
+    return _run_nonpreemptive(processes, lambda w, i: (w.burst[i], i), _explain_sjf, decisions)
+
+
+# ---------------- Round Robin ----------------
+def round_robin_scheduler(processes, quantum=2, decisions=None):
+    """Round Robin; arrivals during a slice queue ahead of the preempted process"""
+    if quantum <= 0:
+        raise ValueError("quantum must be positive")
+    w = _Workload(processes)
+    queue, rows = deque(), _Slices()
+    decisions = [] if decisions is None else decisions
+    want = getattr(decisions, "want", None)
+    remaining, ready_at = [], []
+    now = 0
+    while True:
+        for i in w.admit(now):
+            remaining.append(w.burst[i]); ready_at.append(w.arrival[i])
+            queue.append(i)
+        if not queue:
+            nxt = w.next_arrival()
+            if nxt is None:
+                break
+            now = max(now, nxt)
+            continue
+        i = queue.popleft()
+        before = remaining[i]
+        run = min(quantum, before)
+        after = before - run
+        if want is None or want(len(queue) + 1):
+            decisions.append({
+                "algo": "RR", "time": now, "pid_chosen": w.pid[i], "arrival": ready_at[i], "burst": w.burst[i],
+                "ready_count": len(queue) + 1, "quantum_used": run, "remaining_after": after,
+                "reason_code": Reason.RR_QUEUE_ORDER.value,
+                "queue_position": 1, "remaining_before": before, "now": now
+            })
+        rows.add(i, ready_at[i], now, now + run)
+        now += run
+        remaining[i] = after
+        if after > 0:
+            for j in w.admit(now):
+                remaining.append(w.burst[j]); ready_at.append(w.arrival[j])
+                queue.append(j)
+            ready_at[i] = now
+            queue.append(i)
+    return rows.build(w), decisions
+
+
+# ---------------- Preemptive (SRTF / Priority) ----------------
+def _run_preemptive(processes, algo, key, reason, key_field, decisions=None):
+    w = _Workload(processes)
+    ready, rows = [], _Slices()
+    decisions = [] if decisions is None else decisions
+    want = getattr(decisions, "want", None)
+    remaining, ready_at = [], []
+    now, cur, slice_start = 0, None, 0
+
+    def admit():
+        for i in w.admit(now):
+            remaining.append(w.burst[i]); ready_at.append(w.arrival[i])
+            heapq.heappush(ready, (key(w, remaining, i), i))
+
+    while True:
+        admit()
+        if cur is None:
+            if not ready:
+                nxt = w.next_arrival()
+                if nxt is None:
+                    break
+                now = max(now, nxt)
+                continue
+            k, cur = heapq.heappop(ready)
+            slice_start = now
+            if want is None or want(len(ready) + 1):
+                decisions.append({
+                    "algo": algo, "time": now, "pid_chosen": w.pid[cur], "arrival": ready_at[cur],
+                    "burst": w.burst[cur], "priority": w.priority[cur], "ready_count": len(ready) + 1,
+                    "remaining_before": remaining[cur], "reason_code": reason.value,
+                    key_field: k[0], "now": now
+                })
+        nxt = w.next_arrival()
+        done_at = now + remaining[cur]
+        if nxt is None or done_at <= nxt:
+            rows.add(cur, ready_at[cur], slice_start, done_at)
+            remaining[cur] = 0
+            now, cur = done_at, None
+            continue
+        remaining[cur] -= nxt - now
+        now = nxt
+        admit()
+        cur_key = key(w, remaining, cur)
+        if ready and ready[0][0][0] < cur_key[0]:
+            rows.add(cur, ready_at[cur], slice_start, now)
+            ready_at[cur] = now
+            heapq.heappush(ready, (cur_key, cur))
+            cur = None
+    return rows.build(w), decisions
+
+
+def srtf_scheduler(processes, decisions=None):
+    """Shortest-Remaining-Time-First; a running job is preempted only by a strictly shorter one"""
+    return _run_preemptive(processes, "SRTF", lambda w, rem, i: (rem[i], i),
+                           Reason.SHORTEST_REMAINING, "min_remaining_ready", decisions)
+
+
+def priority_scheduler(processes, decisions=None):
+    """Preemptive priority scheduling; lower 'priority' value runs first, ties by arrival"""
+    return _run_preemptive(processes, "PRIORITY", lambda w, rem, i: (w.priority[i], i),
+                           Reason.HIGHEST_PRIORITY, "min_priority_ready", decisions)
+
+
+SCHEDULERS = {
+    "fcfs": fcfs_scheduler,
+    "sjf": sjf_scheduler,
+    "rr": round_robin_scheduler,
+    "srtf": srtf_scheduler,
+    "priority": priority_scheduler,
+}
+
+LABELS = {"fcfs": "FCFS", "sjf": "SJF", "srtf": "SRTF", "priority": "Priority (preemptive)"}
+
+
+def algo_label(algo, quantum=2):
+    """Display name used in performance_summary.csv"""
+    return f"Round Robin (q={quantum})" if algo == "rr" else LABELS[algo]
+
+
+def run_algorithm(algo, processes, quantum=2, decisions=None):
+    """Dispatch to a scheduler by CLI name; returns (schedule_log, decisions)"""
+    if algo == "rr":
+        return round_robin_scheduler(processes, quantum=quantum, decisions=decisions)
+    return SCHEDULERS[algo](processes, decisions=decisions)
+
+
+# ---------------- Gantt Chart ----------------
+def draw_gantt_chart(schedule_log, title="Scheduling Gantt Chart", show=True):
+    """WebGL Gantt of a schedule (numeric time axis); long runs are merged / bucketed by simulation.gantt"""
+    from simulation import gantt
+    fig = gantt.gantt_figure([("Schedule", gantt.prepare(schedule_log))], title=title)
+    if show:
+        fig.show()
+    return fig
@@ -0,0 +1,157 @@
+# simulation/disk.py — Disk head scheduling (FCFS / SSTF / SCAN / C-SCAN / LOOK / C-LOOK), batch + arrivals-over-time
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+
+import numpy as np
+
+POLICIES = ("FCFS", "SSTF", "SCAN", "C-SCAN", "LOOK", "C-LOOK")
+
+
+# ---------------- Batch (all requests queued at t=0) ----------------
+def _sstf_order(cyl, start, direction):
+    """Served requests always form a contiguous run of the sorted queue, so two pointers suffice"""
+    srt = np.sort(cyl)
+    hi = int(np.searchsorted(srt, start, side="left"))
+    lo, head, out = hi - 1, start, []
+    vals = srt.tolist()
+    while lo >= 0 or hi < len(vals):
+        if hi >= len(vals):
+            take_low = True
+        elif lo < 0:
+            take_low = False
+        else:
+            dl, dh = head - vals[lo], vals[hi] - head
+            take_low = dl < dh or (dl == dh and direction == "down")
+        if take_low:
+            head = vals[lo]; lo -= 1
+        else:
+            head = vals[hi]; hi += 1
+        out.append(head)
+    return np.asarray(out, dtype=cyl.dtype)
+
+
+def disk_schedule(reqs, start, algo="FCFS", direction="up", max_cyl=199):
+    """Serve a static request queue.
+
+    Returns (path, order, total): `path` is every head stop starting at
+    `start`, including the disk edges SCAN/C-SCAN travel to; `order` is the
+    service sequence; `total` is the head movement in cylinders (C-SCAN and
+    C-LOOK count the return sweep).
+    """
+    if algo not in POLICIES:
+        raise ValueError(f"unknown policy: {algo}")
+    cyl = np.asarray(reqs, dtype=np.int64)
+    if cyl.size and (cyl.min() < 0 or cyl.max() > max_cyl):
+        raise ValueError(f"requests must lie within 0..{max_cyl}")
+    srt = np.sort(cyl)
+    here = srt[srt == start]          # served first at zero distance, whichever way the head sweeps
+    up = srt[srt > start]
+    down = srt[srt < start][::-1]
+    edge = {"up": [max_cyl], "down": [0]}
+    empty = np.zeros(0, dtype=np.int64)
+
+    if algo == "FCFS":
+        order, path = cyl, cyl
+    elif algo == "SSTF":
+        order = _sstf_order(cyl, start, direction)
+        path = order
+    else:
+        ahead, behind = (up, down) if direction == "up" else (down, up)
+        ahead = np.concatenate([here, ahead])
+        far = edge[direction]
+        if algo in ("SCAN", "LOOK"):
+            order = np.concatenate([ahead, behind])
+            turn = far if (algo == "SCAN" and behind.size) else []
+            path = np.concatenate([ahead, np.asarray(turn, dtype=np.int64), behind])
+        else:  # circular: wrap to the opposite end and keep sweeping the same way
+            wrapped = behind[::-1]
+            order = np.concatenate([ahead, wrapped])
+            if algo == "C-SCAN" and wrapped.size:
+                wrap = np.asarray(far + edge["down" if direction == "up" else "up"], dtype=np.int64)
+            else:
+                wrap = empty
+            path = np.concatenate([ahead, wrap, wrapped])
+    path = np.concatenate([[start], path]).astype(np.int64)
+    total = int(np.abs(np.diff(path)).sum())
+    return path, order.tolist(), total
+
+
+# ---------------- Dynamic (requests arrive over time) ----------------
+def disk_schedule_dynamic(reqs, arrivals, start, algo="SSTF", direction="up", max_cyl=199,
+                          seek_rate=1.0, service_time=0.0):
+    """Simulate a queue whose requests arrive over time.
+
+    The head moves `seek_rate` cylinders per time unit and spends
+    `service_time` per request; pending requests live in a sorted list and
+    are found with bisect. Returns a dict of NumPy arrays (order, served_at,
+    latency per request in input order) plus total head movement.
+    """
+    if algo not in POLICIES:
+        raise ValueError(f"unknown policy: {algo}")
+    cyl = np.asarray(reqs, dtype=np.int64)
+    arr = np.asarray(arrivals, dtype=np.float64)
+    n = len(cyl)
+    by_time = np.argsort(arr, kind="stable").tolist()
+    cyl_l, arr_l = cyl.tolist(), arr.tolist()
+    pending, fifo = [], deque()
+    served_at = np.zeros(n)
+    order, moves = [], 0
+    t, head, nxt, up = 0.0, start, 0, direction == "up"
+
+    def travel(to):
+        nonlocal t, head, moves
+        dist = abs(to - head)
+        t += dist / seek_rate
+        moves += dist
+        head = to
+
+    while len(order) < n:
+        while nxt < n and arr_l[by_time[nxt]] <= t:
+            i = by_time[nxt]; nxt += 1
+            if algo == "FCFS":
+                fifo.append(i)
+            else:
+                insort(pending, (cyl_l[i], i))
+        if not pending and not fifo:
+            t = max(t, arr_l[by_time[nxt]])
+            continue
+
+        if algo == "FCFS":
+            i = fifo.popleft()
+        else:
+            k_up = bisect_left(pending, (head, -1))           # first request at/above head
+            k_down = bisect_right(pending, (head, n)) - 1      # last request at/below head
+            if algo == "SSTF":
+                if k_up >= len(pending):
+                    k = k_down
+                elif k_down < 0:
+                    k = k_up
+                else:
+                    dl, dh = head - pending[k_down][0], pending[k_up][0] - head
+                    k = k_down if (dl < dh or (dl == dh and not up)) else k_up
+            else:
+                k = k_up if up else k_down
+                if not (0 <= k < len(pending)):
+                    # nothing ahead in the sweep direction
+                    if algo == "SCAN":
+                        travel(max_cyl if up else 0); up = not up
+                        continue
+                    if algo == "LOOK":
+                        up = not up
+                        continue
+                    if algo == "C-SCAN":
+                        travel(max_cyl if up else 0); travel(0 if up else max_cyl)
+                        continue
+                    k = 0 if up else len(pending) - 1           # C-LOOK: jump to the far end of the queue
+            i = pending.pop(k)[1]
+        travel(cyl_l[i])
+        t += service_time
+        served_at[i] = t
+        order.append(i)
+
+    return {
+        "order": np.asarray(order, dtype=np.int64),
+        "served_at": served_at,
+        "latency": served_at - arr,
+        "total_movement": int(moves),
+    }
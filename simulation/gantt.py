@@ -0,0 +1,169 @@
+# simulation/gantt.py — Scalable Gantt rendering: merged slices, time-bucket occupancy, WebGL segment traces
+import numpy as np
+
+from simulation.schedule import as_schedule
+
+MAX_LANES = 120          # more processes than this are drawn as bands of consecutive pids
+MAX_SEGMENTS = 20_000    # a window holding more merged slices is drawn as per-bucket occupancy
+MAX_BUCKETS = 2_000
+LEVELS = (0.25, 0.5, 0.75, 1.0)                             # occupancy bands of the bucketed view
+LEVEL_COLORS = ("#0b4f6c", "#0a88aa", "#00b8d9", "#00e5ff")
+SLICE_COLOR = "#00e5ff"
+
+
+# ---------------- Lanes + merging ----------------
+def assign_lanes(sched, by="pid", max_lanes=MAX_LANES):
+    """Lane per slice plus lane labels: one lane per pid (or core); past `max_lanes` pids share bands"""
+    if by == "core":
+        if sched.core is None:
+            raise ValueError("schedule has no core column")
+        return sched.core, np.array([f"cpu{c}" for c in range(sched.cores)], dtype=object)
+    n = len(sched.pids)
+    labels = sched.pids.astype(str)
+    if n <= max_lanes:
+        return sched.pid_index, labels.astype(object)
+    lane = (sched.pid_index.astype(np.int64) * max_lanes // n).astype(np.int32)
+    first = -(-np.arange(max_lanes + 1) * n // max_lanes)   # first pid index of each band
+    return lane, np.array([f"{labels[a]}…{labels[b - 1]}" for a, b in zip(first[:-1], first[1:])], dtype=object)
+
+
+def merge_slices(lane, start, finish, tol=1e-9):
+    """Join back-to-back slices in the same lane (repeated dispatches of one pid, neighbours in a band)"""
+    if len(start) == 0:
+        return lane, start, finish
+    order = np.lexsort((start, lane))
+    lane, start, finish = lane[order], start[order], finish[order]
+    head = np.ones(len(start), dtype=bool)
+    head[1:] = (lane[1:] != lane[:-1]) | (start[1:] > finish[:-1] + tol)
+    idx = np.flatnonzero(head)
+    return lane[idx], start[idx], np.maximum.reduceat(finish, idx)
+
+
+def prepare(schedule, by="pid", max_lanes=MAX_LANES):
+    """Lane-assigned, merged segments of a ScheduleLog / schedule DataFrame, ready for view()"""
+    sched = as_schedule(schedule)
+    if sched is None:
+        raise ValueError("not a schedule (needs pid, start, finish and arrival or waiting)")
+    lane, labels = assign_lanes(sched, by, max_lanes)
+    lane, start, finish = merge_slices(lane, sched.start, sched.finish)
+    return {"lane": lane, "start": start, "finish": finish, "labels": labels, "slices": len(sched),
+            "t_min": float(start.min()) if len(start) else 0.0, "t_max": float(finish.max()) if len(finish) else 0.0}
+
+
+# ---------------- Windowing ----------------
+def bucket_occupancy(lane, start, finish, n_lanes, t0, width, buckets):
+    """Busy fraction per (lane, bucket) over [t0, t0 + width * buckets); slices may span many buckets"""
+    t1 = t0 + width * buckets
+    s, f = np.clip(start, t0, t1), np.clip(finish, t0, t1)
+    bs = np.minimum(((s - t0) // width).astype(np.int64), buckets - 1)
+    be = np.minimum(((f - t0) // width).astype(np.int64), buckets - 1)
+    row = lane.astype(np.int64) * buckets
+    size = n_lanes * buckets
+    one = bs == be
+    busy = np.zeros(size)   # float64 even when a selection below is empty (bincount would give int64)
+    busy += np.bincount(row[one] + bs[one], weights=(f - s)[one], minlength=size)
+    many = ~one
+    row, s, f, bs, be = row[many], s[many], f[many], bs[many], be[many]
+    busy += np.bincount(row + bs, weights=t0 + (bs + 1) * width - s, minlength=size)   # head partial
+    busy += np.bincount(row + be, weights=f - (t0 + be * width), minlength=size)       # tail partial
+    # whole buckets in between: +1 after the head, -1 at the tail, prefix-summed per lane
+    inner = np.bincount(row + bs + 1, minlength=size) - np.bincount(row + be, minlength=size)
+    busy += inner.reshape(n_lanes, buckets).cumsum(axis=1).ravel() * width
+    return busy.reshape(n_lanes, buckets) / width
+
+
+def _runs(mask):
+    """(row, first column, end column) of every horizontal run of True cells"""
+    padded = np.zeros((mask.shape[0], mask.shape[1] + 2), dtype=np.int8)
+    padded[:, 1:-1] = mask
+    step = np.diff(padded, axis=1)
+    rows, c0 = np.nonzero(step == 1)
+    _, c1 = np.nonzero(step == -1)
+    return rows, c0, c1
+
+
+def view(data, t0=None, t1=None, max_segments=MAX_SEGMENTS):
+    """Traces for the [t0, t1] window of prepared data.
+
+    Up to `max_segments` merged slices are drawn exactly; beyond that the
+    window is cut into buckets (about `max_segments` lane-buckets in all)
+    and each lane's busy buckets are drawn as runs, one trace per
+    occupancy level. Returns {"mode", "bucket", "traces"}; each trace is a
+    dict of name, color, lane, start, finish and hover text.
+    """
+    t0 = data["t_min"] if t0 is None else t0
+    t1 = data["t_max"] if t1 is None else t1
+    lane, start, finish, labels = data["lane"], data["start"], data["finish"], data["labels"]
+    keep = (finish > t0) & (start < t1)
+    if np.count_nonzero(keep) <= max_segments or t1 <= t0:
+        lane, start, finish = lane[keep], start[keep], finish[keep]
+        text = [f"{labels[l]}: {s:g}–{f:g}" for l, s, f in zip(lane.tolist(), start.tolist(), finish.tolist())]
+        return {"mode": "slices", "bucket": None,
+                "traces": [{"name": "slice", "color": SLICE_COLOR, "lane": lane, "start": start, "finish": finish,
+                            "text": text}]}
+    n_lanes = len(labels)
+    buckets = int(np.clip(max_segments // n_lanes, 50, MAX_BUCKETS))
+    width = (t1 - t0) / buckets
+    occ = bucket_occupancy(lane[keep], start[keep], finish[keep], n_lanes, t0, width, buckets)
+    level = np.searchsorted(LEVELS, np.minimum(occ, 1.0))
+    traces, lo = [], 0
+    for k, (hi, color) in enumerate(zip(LEVELS, LEVEL_COLORS)):
+        rows, c0, c1 = _runs((occ > 1e-9) & (level == k))
+        name = f"busy {lo:.0%}–{hi:.0%}"
+        traces.append({"name": name, "color": color, "lane": rows, "start": t0 + c0 * width,
+                       "finish": t0 + c1 * width, "text": [f"{labels[r]} · {name}" for r in rows.tolist()]})
+        lo = hi
+    return {"mode": "buckets", "bucket": width, "traces": traces}
+
+
+# ---------------- Plotly ----------------
+def segments_xy(y, start, finish):
+    """Interleave segments as x0, x1, gap so one line trace draws them all (WebGL breaks on the gaps)"""
+    x = np.empty(3 * len(start))
+    x[0::3], x[1::3], x[2::3] = start, finish, np.nan
+    return x, spread(y)
+
+
+def spread(values):
+    """Repeat each value for both segment ends, with a gap after"""
+    values = np.asarray(values)
+    numeric = values.dtype.kind in "biuf"
+    out = np.empty(3 * len(values), dtype=np.float64 if numeric else object)
+    out[0::3], out[1::3], out[2::3] = values, values, np.nan if numeric else None
+    return out
+
+
+def gantt_figure(runs, t0=None, t1=None, max_segments=MAX_SEGMENTS, title=None):
+    """WebGL Gantt of [(name, prepared data), ...], one row per run on a shared time axis"""
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    t0 = min(d["t_min"] for _, d in runs) if t0 is None else t0
+    t1 = max(d["t_max"] for _, d in runs) if t1 is None else t1
+    views = [view(d, t0, t1, max_segments) for _, d in runs]
+    heights = [int(np.clip(60 + 16 * len(d["labels"]), 160, 420)) for _, d in runs]
+    titles = []
+    for (name, d), v in zip(runs, views):
+        detail = "" if v["mode"] == "slices" else f", occupancy per {v['bucket']:.3g} time units"
+        titles.append(f"{name} — {d['slices']:,} slices{detail}")
+    fig = make_subplots(rows=len(runs), cols=1, shared_xaxes=True, vertical_spacing=min(0.08, 0.5 / len(runs)),
+                        row_heights=heights, subplot_titles=titles)
+    shown = set()
+    for r, ((_, d), v, h) in enumerate(zip(runs, views, heights), 1):
+        n_lanes = len(d["labels"])
+        width = float(np.clip(0.7 * (h - 60) / max(n_lanes, 1), 1, 16))
+        for tr in v["traces"]:
+            x, y = segments_xy(tr["lane"], tr["start"], tr["finish"])
+            fig.add_trace(go.Scattergl(x=x, y=y, mode="lines", name=tr["name"], legendgroup=tr["name"],
+                                       showlegend=tr["name"] not in shown, line=dict(color=tr["color"], width=width),
+                                       text=spread(tr["text"]), hovertemplate="%{text}<extra></extra>"),
+                          row=r, col=1)
+            shown.add(tr["name"])
+        step = max(1, -(-n_lanes // 40))
+        ticks = np.arange(0, n_lanes, step)
+        fig.update_yaxes(range=[n_lanes - 0.5, -0.5], tickvals=ticks, ticktext=d["labels"][ticks].tolist(),
+                         zeroline=False, row=r, col=1)
+    fig.update_xaxes(range=[t0, t1])
+    fig.update_xaxes(title_text="Time", row=len(runs), col=1)
+    fig.update_layout(template="plotly_dark", height=sum(heights) + 60, title=title, hovermode="closest",
+                      margin=dict(t=80 if title else 50))
+    return fig
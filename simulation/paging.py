@@ -0,0 +1,273 @@
+# simulation/paging.py — Page-replacement engine (FIFO / LRU / Clock / LFU / OPT / ARC), O(1)–O(log f) per reference
+import heapq
+from collections import OrderedDict
+
+import numpy as np
+
+
+# ---------------- Policies ----------------
+# Each policy exposes access(page) -> hit and resident() -> pages in frames.
+class FIFO:
+    """Ring buffer of frames; the hand always points at the oldest load"""
+
+    def __init__(self, frames):
+        self.slots, self.where, self.hand = [None] * frames, {}, 0
+
+    def access(self, page):
+        if page in self.where:
+            return True
+        old = self.slots[self.hand]
+        if old is not None:
+            del self.where[old]
+        self.slots[self.hand] = page
+        self.where[page] = self.hand
+        self.hand = (self.hand + 1) % len(self.slots)
+        return False
+
+    def resident(self):
+        return [p for p in self.slots if p is not None]
+
+
+class Clock(FIFO):
+    """Second-chance FIFO: referenced frames are skipped once by the hand"""
+
+    def __init__(self, frames):
+        super().__init__(frames)
+        self.ref = [False] * frames
+
+    def access(self, page):
+        slot = self.where.get(page)
+        if slot is not None:
+            self.ref[slot] = True
+            return True
+        while self.ref[self.hand]:
+            self.ref[self.hand] = False
+            self.hand = (self.hand + 1) % len(self.slots)
+        old = self.slots[self.hand]
+        if old is not None:
+            del self.where[old]
+        self.slots[self.hand], self.ref[self.hand] = page, True
+        self.where[page] = self.hand
+        self.hand = (self.hand + 1) % len(self.slots)
+        return False
+
+
+class LRU:
+    """OrderedDict in recency order (move_to_end on hit, pop oldest on miss)"""
+
+    def __init__(self, frames):
+        self.frames, self.order = frames, OrderedDict()
+
+    def access(self, page):
+        if page in self.order:
+            self.order.move_to_end(page)
+            return True
+        if len(self.order) >= self.frames:
+            self.order.popitem(last=False)
+        self.order[page] = None
+        return False
+
+    def resident(self):
+        return list(self.order)
+
+
+class LFU:
+    """Min-heap on (use count, last use); stale heap entries are skipped lazily"""
+
+    def __init__(self, frames):
+        self.frames, self.count, self.heap, self.tick = frames, {}, [], 0
+
+    def access(self, page):
+        self.tick += 1
+        hit = page in self.count
+        if not hit and len(self.count) >= self.frames:
+            while True:
+                cnt, _, victim = heapq.heappop(self.heap)
+                if self.count.get(victim) == cnt:
+                    del self.count[victim]
+                    break
+        self.count[page] = self.count.get(page, 0) + 1
+        heapq.heappush(self.heap, (self.count[page], self.tick, page))
+        if len(self.heap) > 8 * self.frames + 64:  # drop stale entries
+            self.heap = [e for e in self.heap if self.count.get(e[2]) == e[0]]
+            heapq.heapify(self.heap)
+        return hit
+
+    def resident(self):
+        return list(self.count)
+
+
+class OPT:
+    """Belady's optimal policy: evict the page whose next use is farthest away.
+
+    Needs the whole reference string up front to build the next-use index.
+    """
+
+    def __init__(self, frames, refs):
+        self.frames, self.next_at, self.heap, self.i = frames, {}, [], 0
+        never = len(refs)
+        self.next_use, last = [never] * len(refs), {}
+        for i in range(len(refs) - 1, -1, -1):
+            self.next_use[i] = last.get(refs[i], never)
+            last[refs[i]] = i
+
+    def access(self, page):
+        nxt = self.next_use[self.i]
+        self.i += 1
+        hit = page in self.next_at
+        if not hit and len(self.next_at) >= self.frames:
+            while True:
+                neg, victim = heapq.heappop(self.heap)
+                if self.next_at.get(victim) == -neg:
+                    del self.next_at[victim]
+                    break
+        self.next_at[page] = nxt
+        heapq.heappush(self.heap, (-nxt, page))
+        return hit
+
+    def resident(self):
+        return list(self.next_at)
+
+
+class ARC:
+    """Adaptive Replacement Cache (Megiddo & Modha) with ghost lists B1/B2"""
+
+    def __init__(self, frames):
+        self.c, self.p = frames, 0
+        self.t1, self.t2, self.b1, self.b2 = OrderedDict(), OrderedDict(), OrderedDict(), OrderedDict()
+
+    def _replace(self, in_b2):
+        if self.t1 and (len(self.t1) > self.p or (in_b2 and len(self.t1) == self.p)):
+            old, _ = self.t1.popitem(last=False); self.b1[old] = None
+        else:
+            old, _ = self.t2.popitem(last=False); self.b2[old] = None
+
+    def access(self, page):
+        if page in self.t1:
+            del self.t1[page]; self.t2[page] = None
+            return True
+        if page in self.t2:
+            self.t2.move_to_end(page)
+            return True
+        if page in self.b1:
+            self.p = min(self.c, self.p + max(len(self.b2) // max(len(self.b1), 1), 1))
+            self._replace(False)
+            del self.b1[page]; self.t2[page] = None
+            return False
+        if page in self.b2:
+            self.p = max(0, self.p - max(len(self.b1) // max(len(self.b2), 1), 1))
+            self._replace(True)
+            del self.b2[page]; self.t2[page] = None
+            return False
+        l1 = len(self.t1) + len(self.b1)
+        if l1 == self.c:
+            if len(self.t1) < self.c:
+                self.b1.popitem(last=False)
+                self._replace(False)
+            else:
+                self.t1.popitem(last=False)
+        elif l1 < self.c:
+            total = l1 + len(self.t2) + len(self.b2)
+            if total >= self.c:
+                if total == 2 * self.c:
+                    self.b2.popitem(last=False)
+                self._replace(False)
+        self.t1[page] = None
+        return False
+
+    def resident(self):
+        return list(self.t1) + list(self.t2)
+
+
+POLICIES = {"FIFO": FIFO, "LRU": LRU, "Clock": Clock, "LFU": LFU, "OPT": OPT, "ARC": ARC}
+
+
+# ---------------- Reference Streams ----------------
+def iter_refs(source, chunk_bytes=1 << 20):
+    """Stream integer page references from a whitespace/comma separated file (path or text file object)"""
+    tail = ""
+    with (open(source) if isinstance(source, str) else source) as fh:
+        while True:
+            chunk = fh.read(chunk_bytes)
+            if not chunk:
+                break
+            tokens = (tail + chunk).replace(",", " ").split()
+            tail = "" if chunk[-1].isspace() or chunk[-1] == "," or not tokens else tokens.pop()
+            for tok in tokens:
+                yield int(tok)
+    if tail:
+        yield int(tail)
+
+
+# ---------------- Driver ----------------
+def simulate_paging(refs, frames, policy="FIFO", timeline=True, sample_every=1):
+    """Run `refs` (any iterable; OPT materialises it) through a replacement policy.
+
+    Returns (timeline, faults, hit_ratio). The timeline is a list of
+    {t, page, hit, frames} dicts recorded every `sample_every` references,
+    or None when `timeline` is False.
+    """
+    if frames < 1:
+        raise ValueError("frames must be >= 1")
+    if policy == "OPT":
+        refs = list(refs)
+        engine = OPT(frames, refs)
+    else:
+        engine = POLICIES[policy](frames)
+    access = engine.access
+    hits = n = 0
+    rows = [] if timeline else None
+    for n, page in enumerate(refs, 1):
+        hit = access(page)
+        hits += hit
+        if rows is not None and (n - 1) % sample_every == 0:
+            rows.append({"t": n - 1, "page": page, "hit": hit, "frames": engine.resident()})
+    return rows, n - hits, hits / max(n, 1)
+
+
+# ---------------- Stack-distance (Mattson) analysis ----------------
+def stack_distances(refs):
+    """LRU stack distance of every reference (0 marks a first touch), O(n log n).
+
+    A Fenwick tree over access times holds a 1 at each page's latest access;
+    the distance is the number of distinct pages touched since the previous
+    access to the same page, plus one.
+    """
+    refs = refs if isinstance(refs, list) else list(refs)
+    n = len(refs)
+    tree = [0] * (n + 1)
+    last = {}
+    out = np.zeros(n, dtype=np.int64)
+    for i, page in enumerate(refs, 1):
+        p = last.get(page)
+        if p is not None:
+            seen, k = 0, p  # marks at times <= p
+            while k:
+                seen += tree[k]; k &= k - 1
+            out[i - 1] = len(last) - seen + 1
+            k = p
+            while k <= n:
+                tree[k] -= 1; k += k & -k
+        k = i
+        while k <= n:
+            tree[k] += 1; k += k & -k
+        last[page] = i
+    return out
+
+
+def lru_hit_ratio_curve(refs, max_frames=None):
+    """Hit and miss ratio of LRU for every frame count 1..max_frames from one pass.
+
+    Returns {"frames", "hit_ratio", "miss_ratio"} NumPy arrays; LRU with f
+    frames hits exactly the references whose stack distance is <= f.
+    """
+    dist = stack_distances(refs)
+    n = max(len(dist), 1)
+    reuse = dist[dist > 0]
+    top = int(reuse.max()) if reuse.size else 1
+    max_frames = max_frames or top
+    hist = np.bincount(reuse, minlength=max_frames + 1)[:max_frames + 1]
+    hits = np.cumsum(hist)[1:]  # distances beyond max_frames count as misses everywhere
+    frames = np.arange(1, max_frames + 1)
+    hit_ratio = hits / n
+    return {"frames": frames, "hit_ratio": hit_ratio, "miss_ratio": 1.0 - hit_ratio}
@@ -0,0 +1,117 @@
+# simulation/run_store.py — Columnar run store: one Parquet directory per run + append-only JSONL manifest
+import json
+import os
+import time
+import uuid
+
+from simulation.schedule import read_schedule
+from simulation.xai import DecisionWriter
+
+# Column names of the legacy performance_summary.csv, kept for the comparison views
+SUMMARY_COLUMNS = {
+    "avg_wait": "Average Waiting Time",
+    "avg_tat": "Average Turnaround Time",
+    "cpu_util": "CPU Utilization (%)",
+    "throughput": "Throughput",
+}
+
+# Runs are only comparable on the same workload: spec, seed and simulated core count
+WORKLOAD_KEYS = ("workload", "seed", "cores")
+
+
+class RunStore:
+    """Each run lives in <root>/<run_id>/{schedule,decisions}.parquet; <root>/manifest.jsonl
+    gets one line per run (id, label, parameters, metrics), so recording a run
+    is an O(1) append instead of a read-concat-rewrite of a summary CSV.
+    """
+
+    def __init__(self, root="runs"):
+        self.root = root
+        self.manifest = os.path.join(root, "manifest.jsonl")
+
+    # ---------- write ----------
+    def new_run(self):
+        """Allocate a run_id and its directory"""
+        run_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        os.makedirs(os.path.join(self.root, run_id), exist_ok=True)
+        return run_id
+
+    def decision_writer(self, run_id):
+        """Streaming sink for a run's decisions (pass it to the scheduler, then close it)"""
+        return DecisionWriter(self.path(run_id, "decisions"))
+
+    def save_run(self, schedule_log, decisions, label, params=None, metrics=None, run_id=None):
+        """Persist one run and return its run_id.
+
+        `decisions` may be None when they were already streamed through
+        decision_writer(run_id).
+        """
+        import pyarrow.parquet as pq
+        run_id = run_id or self.new_run()
+        pq.write_table(schedule_log.to_arrow(), self.path(run_id, "schedule"))
+        if decisions:
+            with self.decision_writer(run_id) as writer:
+                writer.write_all(decisions)
+        entry = {
+            "run_id": run_id,
+            "created": time.time(),
+            "label": label,
+            "params": params or {},
+            "metrics": {k: float(v) for k, v in (metrics or schedule_log.metrics()).items()},
+            "rows": len(schedule_log),
+        }
+        with open(self.manifest, "a", encoding="utf-8") as fh:
+            fh.write(json.dumps(entry) + "\n")
+        return run_id
+
+    # ---------- read ----------
+    def runs(self):
+        """Manifest entries, oldest first"""
+        if not os.path.exists(self.manifest):
+            return []
+        with open(self.manifest, encoding="utf-8") as fh:
+            return [json.loads(line) for line in fh if line.strip()]
+
+    def workloads(self):
+        """Distinct (workload, seed, cores) tuples in the manifest, most recently run first"""
+        seen = {}
+        for r in self.runs():
+            seen.pop(workload_key(r), None)
+            seen[workload_key(r)] = None
+        return list(reversed(seen))
+
+    def summary(self, latest_only=False, workload=None):
+        """performance_summary-shaped DataFrame (one row per run, or the newest run per label and workload).
+
+        `workload` is a tuple from workloads(); when given, only runs on that
+        workload are returned, so their metrics can be compared directly.
+        """
+        import pandas as pd
+        rows = [{"run_id": r["run_id"], "created": pd.to_datetime(r["created"], unit="s"), "Algorithm": r["label"],
+                 **{col: r["metrics"].get(key) for key, col in SUMMARY_COLUMNS.items()},
+                 **dict.fromkeys(WORKLOAD_KEYS), **r["params"]}
+                for r in self.runs() if workload is None or workload_key(r) == tuple(workload)]
+        df = pd.DataFrame(rows)
+        if latest_only and not df.empty:
+            # seeds / core counts may be None (NaN in the frame); drop_duplicates treats NaNs as equal
+            df = df.drop_duplicates(["Algorithm", *WORKLOAD_KEYS], keep="last").reset_index(drop=True)
+        return df
+
+    def path(self, run_id, table):
+        """File backing one run's table (it may not exist, e.g. runs saved without decisions)"""
+        return os.path.join(self.root, run_id, f"{table}.parquet")
+
+    def load(self, run_id, table="decisions", columns=None, filters=None):
+        """Read one run's table as a DataFrame, projecting `columns` and pushing `filters` down to Parquet
+        (a schedule keeps its SMP core count in df.attrs)"""
+        import pandas as pd
+        path = self.path(run_id, table)
+        if not os.path.exists(path):
+            return pd.DataFrame()
+        return read_schedule(path, columns=columns, filters=filters)
+
+
+def workload_key(entry):
+    """(workload, seed, cores) of a manifest entry; keys missing from older entries are None"""
+    params = entry.get("params", {})
+    return tuple(params.get(k) for k in WORKLOAD_KEYS)
@@ -0,0 +1,189 @@
+# simulation/schedule.py — Columnar (struct-of-arrays) schedule log + vectorized metrics
+import numpy as np
+
+CORES_KEY = b"xai.cores"   # Parquet schema metadata: simulated core count (idle cores leave no slices)
+
+
+class ScheduleLog:
+    """Executed CPU slices stored as NumPy columns, one row per slice.
+
+    `pid_index` points into `pids` (one label per process). Absolute times
+    (arrival/start/finish) are float64 so long traces keep integer precision;
+    durations (burst/waiting/turnaround) are float32. `attrs` holds optional
+    per-process columns (e.g. process name), also indexed by pid index.
+    Multi-core runs add a per-slice `core` column and the core count, which
+    utilization is normalised by. The count travels with the data as
+    DataFrame.attrs["cores"] and Parquet schema metadata, since cores that
+    never ran cannot be recovered from the column.
+    """
+    COLUMNS = ("pid", "arrival", "burst", "start", "finish", "waiting", "turnaround")
+
+    def __init__(self, pid_index, pids, arrival, burst, start, finish, attrs=None, core=None, cores=1):
+        self.pid_index = np.asarray(pid_index, dtype=np.int32)
+        self.pids = np.asarray(pids, dtype=object)
+        self.attrs = {k: np.asarray(v) for k, v in (attrs or {}).items()}
+        self.arrival = np.asarray(arrival, dtype=np.float64)
+        self.burst = np.asarray(burst, dtype=np.float32)
+        self.start = np.asarray(start, dtype=np.float64)
+        self.finish = np.asarray(finish, dtype=np.float64)
+        self.waiting = (self.start - self.arrival).astype(np.float32)
+        self.turnaround = (self.finish - self.arrival).astype(np.float32)
+        self.core = None if core is None else np.asarray(core, dtype=np.int32)
+        self.cores = int(cores)
+
+    # ---------- construction ----------
+    @classmethod
+    def from_records(cls, records):
+        """Build from the legacy list-of-dicts schedule_log"""
+        pids, index, idx = [], {}, []
+        for r in records:
+            i = index.get(r['pid'])
+            if i is None:
+                i = index[r['pid']] = len(pids); pids.append(r['pid'])
+            idx.append(i)
+        col = lambda k: np.fromiter((r[k] for r in records), dtype=np.float64, count=len(records))
+        return cls(idx, pids, col('arrival'), col('burst'), col('start'), col('finish'))
+
+    @classmethod
+    def from_pandas(cls, df):
+        """Build from a DataFrame with pid/start/finish and waiting or arrival columns (plus core, if present).
+
+        The core count is taken from df.attrs["cores"] when set (see
+        read_schedule()), else inferred from the highest core that ran.
+        """
+        codes, pids = _factorize(df['pid'])
+        start = df['start'].to_numpy(np.float64)
+        arrival = df['arrival'].to_numpy(np.float64) if 'arrival' in df.columns else start - df['waiting'].to_numpy(np.float64)
+        finish = df['finish'].to_numpy(np.float64)
+        burst = df['burst'].to_numpy(np.float32) if 'burst' in df.columns else finish - start
+        if 'core' in df.columns and len(df):
+            core = df['core'].to_numpy(np.int32)
+            cores = max(int(df.attrs.get("cores", 0)), int(core.max()) + 1)
+            return cls(codes, pids, arrival, burst, start, finish, core=core, cores=cores)
+        return cls(codes, pids, arrival, burst, start, finish)
+
+    # ---------- row access (legacy callers) ----------
+    def __len__(self):
+        return len(self.pid_index)
+
+    def __iter__(self):
+        labels = self.pids[self.pid_index].tolist()
+        cols = [labels] + [getattr(self, c).tolist() for c in self.COLUMNS[1:]]
+        for row in zip(*cols):
+            yield dict(zip(self.COLUMNS, row))
+
+    def labels(self):
+        """pid label per row"""
+        return self.pids[self.pid_index]
+
+    # ---------- conversion ----------
+    def to_pandas(self):
+        """DataFrame view; numeric columns share memory with this log"""
+        import pandas as pd
+        pid = self.labels()
+        if len(self.pids) == len(set(self.pids.tolist())):
+            pid = pd.Categorical.from_codes(self.pid_index, categories=self.pids)
+        cols = {"pid": pid}
+        cols.update({k: v[self.pid_index] for k, v in self.attrs.items()})
+        cols.update({c: getattr(self, c) for c in self.COLUMNS[1:]})
+        if self.core is not None:
+            cols["core"] = self.core
+        df = pd.DataFrame(cols, copy=False)
+        if self.core is not None:
+            df.attrs["cores"] = self.cores
+        return df
+
+    def to_arrow(self):
+        """pyarrow Table; numeric columns are zero-copy, pid is dictionary-encoded"""
+        import pyarrow as pa
+        pid = pa.DictionaryArray.from_arrays(pa.array(self.pid_index), pa.array(self.pids.tolist()))
+        cols = {"pid": pid}
+        cols.update({k: pa.array(v[self.pid_index]) for k, v in self.attrs.items()})
+        cols.update({c: pa.array(getattr(self, c)) for c in self.COLUMNS[1:]})
+        if self.core is None:
+            return pa.table(cols)
+        cols["core"] = pa.array(self.core)
+        return pa.table(cols, metadata={CORES_KEY: str(self.cores).encode()})
+
+    # ---------- metrics ----------
+    def per_process(self):
+        """Total waiting, CPU time and turnaround per pid index (slices aggregated)"""
+        n = len(self.pids)
+        seen = np.bincount(self.pid_index, minlength=n) > 0
+        wait = np.bincount(self.pid_index, weights=self.waiting, minlength=n)[seen]
+        run = np.bincount(self.pid_index, weights=self.finish - self.start, minlength=n)[seen]
+        return {"waiting": wait, "cpu_time": run, "turnaround": wait + run}
+
+    def per_core(self):
+        """Busy time per core (a single entry for single-CPU logs)"""
+        run = self.finish - self.start
+        if self.core is None:
+            return np.array([run.sum()])
+        return np.bincount(self.core, weights=run, minlength=self.cores)
+
+    def metrics(self):
+        """Same keys as perf_from_schedule: avg_wait, avg_tat, throughput, cpu_util, eff.
+
+        Rates are left out when the schedule spans no time (all bursts zero):
+        there is nothing to divide by.
+        """
+        if len(self) == 0:
+            return {}
+        pp = self.per_process()
+        out = {"avg_wait": float(pp['waiting'].mean()), "avg_tat": float(pp['turnaround'].mean())}
+        makespan = float(self.finish.max() - self.start.min())
+        if makespan <= 0:
+            return out
+        busy = float((self.finish - self.start).sum())
+        out["throughput"] = len(pp['waiting']) / makespan
+        out["cpu_util"] = 100.0 * busy / (makespan * self.cores)
+        out["eff"] = out["throughput"] / float(pp['cpu_time'].mean())
+        return out
+
+
+def _factorize(values):
+    import pandas as pd
+    codes, uniques = pd.factorize(values)
+    return codes, np.asarray(uniques, dtype=object)
+
+
+def read_schedule(path, **kwargs):
+    """pd.read_parquet that restores a stored schedule's SMP core count into df.attrs (other tables read as-is)"""
+    import pandas as pd
+    import pyarrow.parquet as pq
+    df = pd.read_parquet(path, **kwargs)
+    meta = pq.read_schema(path).metadata or {}
+    if CORES_KEY in meta:
+        df.attrs["cores"] = int(meta[CORES_KEY])
+    return df
+
+
+def as_schedule(obj):
+    """Coerce a ScheduleLog, DataFrame or list of dicts into a ScheduleLog (None if not a schedule)"""
+    if isinstance(obj, ScheduleLog):
+        return obj
+    if isinstance(obj, list):
+        return ScheduleLog.from_records(obj)
+    cols = set(getattr(obj, 'columns', ()))
+    if {'pid', 'start', 'finish'}.issubset(cols) and cols & {'arrival', 'waiting'}:
+        return ScheduleLog.from_pandas(obj)
+    return None
+
+
+def perf_from_schedule(df):
+    """Scheduling KPIs for a ScheduleLog or any DataFrame that carries schedule columns"""
+    if df is None or len(df) == 0:
+        return {}
+    sched = as_schedule(df)
+    if sched is not None:
+        return sched.metrics()
+    out = {}
+    if {'waiting', 'turnaround'}.issubset(df.columns):
+        out['avg_wait'] = df['waiting'].mean()
+        out['avg_tat'] = df['turnaround'].mean()
+    if {'start', 'finish'}.issubset(df.columns):
+        makespan = df['finish'].max() - df['start'].min()
+        if makespan > 0:
+            out['throughput'] = len(df) / makespan
+            out['cpu_util'] = 100.0 * (df['finish'] - df['start']).sum() / makespan
+    return out
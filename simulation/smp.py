@@ -0,0 +1,150 @@
+# simulation/smp.py — Multi-core (SMP) scheduling: per-core run queues + work stealing / periodic balancing
+import heapq
+from array import array
+from collections import deque
+
+import numpy as np
+
+from simulation.cpu_scheduler import _Slices, _Workload
+
+SMP_ALGOS = ("fcfs", "sjf", "rr")
+BALANCERS = ("steal", "periodic", "none")
+
+
+def smp_schedule(processes, cores=4, algo="fcfs", quantum=2, balance="steal", balance_interval=10.0):
+    """Simulate `cores` CPUs, each with its own FCFS / SJF / RR run queue.
+
+    Arrivals go to an idle core if there is one, otherwise to the next core
+    in round-robin order. `balance` picks how queues are evened out:
+    "steal" lets a core that runs dry take one job from the longest queue;
+    "periodic" moves jobs from the longest to the shortest queues every
+    `balance_interval` time units; "none" keeps every job where it landed.
+    Cores never preempt across queues.
+
+    Returns (ScheduleLog with a per-slice `core` column, stats) where stats
+    holds makespan, per-core busy time / utilization and migration counts.
+    """
+    if algo not in SMP_ALGOS:
+        raise ValueError(f"unsupported SMP algorithm: {algo}")
+    if balance not in BALANCERS:
+        raise ValueError(f"unknown balancer: {balance}")
+    if cores < 1:
+        raise ValueError("cores must be >= 1")
+    rr = algo == "rr"
+    if rr and quantum <= 0:
+        raise ValueError("quantum must be positive")
+
+    w = _Workload(processes)
+    rows, core_col = _Slices(), array('i')
+    queues = [deque() for _ in range(cores)] if rr else [[] for _ in range(cores)]
+    remaining, ready_at = [], []
+    running = [-1] * cores
+    idle = list(range(cores - 1, -1, -1))   # stack: core 0 is handed out first
+    done = []                                # (finish time, core) of running slices
+    next_core, migrations, steals = 0, 0, 0
+    queued = 0                               # jobs waiting in any run queue (skips futile steal scans)
+    next_tick = balance_interval if balance == "periodic" else None
+
+    def enqueue(c, i):
+        nonlocal queued
+        queued += 1
+        if rr:
+            queues[c].append(i)
+        else:
+            heapq.heappush(queues[c], (w.burst[i], i) if algo == "sjf" else (i, i))
+
+    def take(q):
+        nonlocal queued
+        queued -= 1
+        return q.popleft() if rr else heapq.heappop(q)[1]
+
+    def dispatch(c, now):
+        nonlocal migrations, steals
+        q = queues[c]
+        if not q and queued and balance == "steal":
+            victim = max(range(cores), key=lambda k: len(queues[k]))
+            if queues[victim]:
+                i = _steal(queues[victim])
+                enqueue(c, i)
+                migrations += 1; steals += 1
+        if not q:
+            running[c] = -1
+            idle.append(c)
+            return
+        i = take(q)
+        run = min(quantum, remaining[i]) if rr else remaining[i]
+        rows.add(i, ready_at[i], now, now + run)
+        core_col.append(c)
+        remaining[i] -= run
+        running[c] = i
+        heapq.heappush(done, (now + run, c))
+
+    def _steal(q):
+        # RR takes the newest job from the tail; heap queues hand over their next job
+        nonlocal queued
+        queued -= 1
+        return q.pop() if rr else heapq.heappop(q)[1]
+
+    def rebalance(now):
+        nonlocal migrations
+        lengths = [len(q) for q in queues]
+        while True:
+            hi = max(range(cores), key=lengths.__getitem__)
+            lo = min(range(cores), key=lengths.__getitem__)
+            if lengths[hi] - lengths[lo] <= 1:
+                break
+            enqueue(lo, _steal(queues[hi]))
+            lengths[hi] -= 1; lengths[lo] += 1
+            migrations += 1
+        for c in [c for c in idle if queues[c]]:
+            idle.remove(c)
+            dispatch(c, now)
+
+    while True:
+        t_arr = w.next_arrival()
+        t_done = done[0][0] if done else None
+        if t_arr is None and t_done is None:
+            break
+        t_next = min(t for t in (t_arr, t_done) if t is not None)
+        if next_tick is not None and next_tick < t_next:
+            rebalance(next_tick)
+            # skip ticks that would fall inside an idle gap
+            next_tick = max(next_tick + balance_interval, t_next - t_next % balance_interval)
+            continue
+        if t_arr is not None and t_arr <= t_next:   # arrivals first on ties
+            woken = []
+            for i in w.admit(t_arr):
+                remaining.append(w.burst[i]); ready_at.append(w.arrival[i])
+                if idle:
+                    c = idle.pop()
+                    woken.append(c)
+                else:
+                    c, next_core = next_core, (next_core + 1) % cores
+                enqueue(c, i)
+            # dispatch once every arrival at this timestamp is queued, so SJF chooses among
+            # all of them; a job arriving later still waits for the next dispatch on its core
+            for c in woken:
+                dispatch(c, t_arr)
+            continue
+        now, c = heapq.heappop(done)
+        i = running[c]
+        if remaining[i] > 0:
+            ready_at[i] = now
+            enqueue(c, i)
+        dispatch(c, now)
+
+    core = np.frombuffer(core_col, dtype=np.intc) if len(core_col) else np.zeros(0, np.int32)
+    log = rows.build(w, core=core, cores=cores)
+    busy = log.per_core()
+    makespan = float(log.finish.max() - log.start.min()) if len(log) else 0.0
+    stats = {
+        "cores": cores,
+        "makespan": makespan,
+        "busy": busy,
+        "utilization": 100.0 * busy / max(makespan, 1e-9),
+        "migrations": migrations,
+        "steals": steals,
+        "imbalance": float(busy.max() / max(busy.mean(), 1e-9)) if cores else 0.0,
+    }
+    return log, stats
+
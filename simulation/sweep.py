@@ -0,0 +1,77 @@
+# simulation/sweep.py — Parameter sweeps (algorithms × quanta × workloads × seeds) over a process pool
+import csv
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from simulation.cpu_scheduler import algo_label, run_algorithm
+from simulation.xai import Discard
+from simulation.workload import is_synthetic, load_workload, parse_synthetic
+
+SUMMARY_FIELDS = ["Algorithm", "Average Waiting Time", "Average Turnaround Time", "CPU Utilization (%)", "Throughput",
+                  "algo", "quantum", "workload", "seed", "processes", "runtime_s"]
+
+
+# ---------------- Grid ----------------
+def parse_ints(tokens):
+    """Expand CLI tokens like ['1-5', '8', '10-50:10'] into a sorted list of ints"""
+    out = set()
+    for tok in tokens:
+        for part in str(tok).split(","):
+            if not part:
+                continue
+            rng, _, step = part.partition(":")
+            lo, _, hi = rng.partition("-")
+            out.update(range(int(lo), int(hi or lo) + 1, int(step or 1)))
+    return sorted(out)
+
+
+def build_grid(algos, quanta, workloads, seeds):
+    """Cartesian grid; quanta only multiply RR and seeds only multiply synthetic workloads"""
+    for workload in workloads:
+        if is_synthetic(workload):
+            parse_synthetic(workload)  # reject a malformed spec here, not in every pool worker
+    points = []
+    for algo, workload in itertools.product(algos, workloads):
+        qs = quanta if algo == "rr" else [None]
+        ss = seeds if is_synthetic(workload) else [None]
+        points.extend({"algo": algo, "quantum": q, "workload": workload, "seed": s}
+                      for q, s in itertools.product(qs, ss))
+    return points
+
+
+def run_point(point):
+    """Run one grid point and return its summary row (executed inside a pool worker)"""
+    algo, quantum = point["algo"], point["quantum"] or 2
+    processes = load_workload(point["workload"], point["seed"] or 0)
+    t0 = time.perf_counter()
+    schedule_log, _ = run_algorithm(algo, processes, quantum=quantum, decisions=Discard())
+    m = schedule_log.metrics()
+    return {
+        "Algorithm": algo_label(algo, quantum),
+        "Average Waiting Time": m.get('avg_wait'),
+        "Average Turnaround Time": m.get('avg_tat'),
+        "CPU Utilization (%)": m.get('cpu_util'),
+        "Throughput": m.get('throughput'),
+        "algo": algo, "quantum": point["quantum"], "workload": point["workload"], "seed": point["seed"],
+        "processes": len(schedule_log.pids), "runtime_s": time.perf_counter() - t0,
+    }
+
+
+# ---------------- Runner ----------------
+def run_sweep(points, out_path="sweep_summary.csv", workers=None):
+    """Fan `points` out over a ProcessPoolExecutor, streaming rows into one CSV as they finish.
+
+    Yields each row so callers can report progress.
+    """
+    workers = workers or os.cpu_count() or 1
+    with open(out_path, "w", newline="") as fh, ProcessPoolExecutor(max_workers=workers) as pool:
+        writer = csv.DictWriter(fh, fieldnames=SUMMARY_FIELDS)
+        writer.writeheader()
+        futures = [pool.submit(run_point, p) for p in points]
+        for fut in as_completed(futures):
+            row = fut.result()
+            writer.writerow(row)
+            fh.flush()
+            yield row
@@ -0,0 +1,140 @@
+# simulation/workload.py — Synthetic workload generation + chunked trace loading for the scheduler engine
+import os
+
+import numpy as np
+
+# The three-process demo workload main.py has always used
+DEFAULT_PROCESSES = [
+    {'pid': 'P1', 'arrival': 0, 'burst': 5, 'priority': 2},
+    {'pid': 'P2', 'arrival': 2, 'burst': 3, 'priority': 1},
+    {'pid': 'P3', 'arrival': 4, 'burst': 1, 'priority': 3}
+]
+
+ARRIVALS = ("poisson", "bursty", "uniform")
+BURSTS = ("exponential", "pareto", "lognormal", "uniform")
+
+
+# ---------------- Distributions ----------------
+def _arrivals(rng, n, kind, rate, burstiness):
+    if kind == "poisson":
+        return np.cumsum(rng.exponential(1.0 / rate, n))
+    if kind == "bursty":
+        # Two-state Markov-modulated Poisson: flip between a fast and a slow phase
+        phase = np.cumsum(rng.random(n) < 0.02) % 2
+        rates = np.where(phase == 1, rate * burstiness, rate / burstiness)
+        rates *= (burstiness + 1 / burstiness) / 2  # keep the long-run mean gap at 1/rate
+        return np.cumsum(rng.exponential(1.0, n) / rates)
+    if kind == "uniform":
+        return np.sort(rng.uniform(0, n / rate, n))
+    raise ValueError(f"unknown arrival distribution: {kind}")
+
+
+def _bursts(rng, n, kind, mean):
+    if kind == "exponential":
+        return rng.exponential(mean, n)
+    if kind == "pareto":
+        alpha = 1.5  # heavy tail, finite mean
+        return (rng.pareto(alpha, n) + 1) * mean * (alpha - 1) / alpha
+    if kind == "lognormal":
+        sigma = 1.0
+        return rng.lognormal(np.log(mean) - sigma ** 2 / 2, sigma, n)
+    if kind == "uniform":
+        return rng.uniform(0, 2 * mean, n)
+    raise ValueError(f"unknown burst distribution: {kind}")
+
+
+def generate_workload(n, arrival="poisson", burst="exponential", rate=0.2, mean_burst=4.0,
+                      burstiness=8.0, priorities=6, integer=True, seed=0):
+    """Seeded synthetic workload as arrival-sorted NumPy columns (pid, arrival, burst, priority).
+
+    `rate` is arrivals per time unit; with `integer` times are whole ticks and bursts ≥ 1.
+    """
+    rng = np.random.default_rng(seed)
+    arr = _arrivals(rng, n, arrival, rate, burstiness)
+    bur = _bursts(rng, n, burst, mean_burst)
+    if integer:
+        arr = np.floor(arr).astype(np.int64)
+        bur = np.maximum(np.ceil(bur), 1).astype(np.int64)
+    else:
+        bur = np.maximum(bur, 1e-6)
+    return {
+        "pid": np.char.add("P", np.arange(1, n + 1).astype(str)),
+        "arrival": arr,
+        "burst": bur,
+        "priority": rng.integers(0, priorities, n),
+    }
+
+
+def iter_processes(columns):
+    """Yield scheduler process dicts from arrival-sorted columns without materialising a list"""
+    cols = {k: (v.tolist() if hasattr(v, "tolist") else list(v)) for k, v in columns.items()}
+    keys = list(cols)
+    for row in zip(*(cols[k] for k in keys)):
+        yield dict(zip(keys, row))
+
+
+# ---------------- Trace Files ----------------
+def iter_trace_chunks(path, chunksize=250_000):
+    """Yield DataFrame chunks of a CSV or Parquet trace (pid, arrival, burst[, priority])"""
+    import pandas as pd
+    if path.endswith((".parquet", ".pq")):
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=chunksize)
+
+
+def stream_trace(path, chunksize=250_000):
+    """Stream an arrival-sorted trace into the engine one chunk at a time"""
+    for chunk in iter_trace_chunks(path, chunksize):
+        cols = {"pid": chunk["pid"].astype(str).to_numpy(), "arrival": chunk["arrival"].to_numpy(),
+                "burst": chunk["burst"].to_numpy()}
+        if "priority" in chunk.columns:
+            cols["priority"] = chunk["priority"].to_numpy()
+        yield from iter_processes(cols)
+
+
+def save_workload(columns, path):
+    """Write generated columns as a CSV or Parquet trace"""
+    import pandas as pd
+    df = pd.DataFrame(columns)
+    if path.endswith((".parquet", ".pq")):
+        df.to_parquet(path, index=False)
+    else:
+        df.to_csv(path, index=False)
+
+
+# ---------------- Workload Specs (CLI / sweep) ----------------
+def is_synthetic(spec):
+    """'random:<n>' or '<arrival>-<burst>:<n>', e.g. 'bursty-pareto:1000000'"""
+    head = spec.split(":", 1)[0]
+    if head == "random":
+        return True
+    arrival, _, burst = head.partition("-")
+    return arrival in ARRIVALS and burst in BURSTS
+
+
+def parse_synthetic(spec):
+    """(arrival, burst, n) of a synthetic spec; ValueError naming the expected form otherwise"""
+    head, sep, count = spec.partition(":")
+    try:
+        n = int(float(count)) if sep else -1
+    except ValueError:
+        n = -1
+    if n < 0:
+        raise ValueError(f"synthetic workload {spec!r} needs a process count: '{head}:<n>', e.g. '{head}:100000'")
+    arrival, burst = ("poisson", "exponential") if head == "random" else head.split("-")
+    return arrival, burst, n
+
+
+def load_workload(spec, seed=0, chunksize=250_000):
+    """Resolve a workload spec to an iterable of processes (trace files are streamed)"""
+    if spec == "default":
+        return [dict(p) for p in DEFAULT_PROCESSES]
+    if is_synthetic(spec):
+        arrival, burst, n = parse_synthetic(spec)
+        return iter_processes(generate_workload(n, arrival, burst, seed=seed))
+    if not os.path.exists(spec):
+        raise FileNotFoundError(spec)
+    return stream_trace(spec, chunksize)
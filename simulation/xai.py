@@ -0,0 +1,188 @@
+# simulation/xai.py — Compact scheduler decision records: reason codes, sampling sinks, streaming writer
+import csv
+from enum import IntEnum
+
+
+# ---------------- Reason Codes ----------------
+class Reason(IntEnum):
+    EARLIEST_ARRIVAL = 1
+    SHORTEST_BURST = 2
+    RR_QUEUE_ORDER = 3
+    SHORTEST_REMAINING = 4
+    HIGHEST_PRIORITY = 5
+
+
+# Decisions store `reason_code` plus the numeric fields these templates read;
+# text is only produced for display / legacy CSV export.
+TEMPLATES = {
+    Reason.EARLIEST_ARRIVAL: "Chose {pid_chosen} because it had the earliest arrival among ready processes.",
+    Reason.SHORTEST_BURST: "Chose {pid_chosen} due to shortest burst time among ready processes.",
+    Reason.RR_QUEUE_ORDER: "Chose {pid_chosen} by Round Robin queue order; ran for {quantum_used:g} time unit(s), "
+                           "remaining after slice ≈ {remaining_after:g}.",
+    Reason.SHORTEST_REMAINING: "Chose {pid_chosen} because it had the shortest remaining time among ready processes.",
+    Reason.HIGHEST_PRIORITY: "Chose {pid_chosen} because it had the highest priority (lowest value) among ready processes.",
+}
+
+# Numeric fields each reason code's decisions carry on top of algo/time/pid_chosen/
+# arrival/burst/ready_count/reason_code/now; DecisionWriter declares its columns from these.
+REASON_FIELDS = {
+    Reason.EARLIEST_ARRIVAL: ("arrival_of_chosen", "min_arrival_ready"),
+    Reason.SHORTEST_BURST: ("burst_of_chosen", "min_burst_ready"),
+    Reason.RR_QUEUE_ORDER: ("quantum_used", "remaining_after", "queue_position", "remaining_before"),
+    Reason.SHORTEST_REMAINING: ("priority", "remaining_before", "min_remaining_ready"),
+    Reason.HIGHEST_PRIORITY: ("priority", "remaining_before", "min_priority_ready"),
+}
+
+
+def reason_text(decision):
+    """English explanation for one decision dict (or DataFrame row)"""
+    code = decision.get("reason_code")
+    if code is None or code != code:  # missing / NaN
+        return decision.get("reason", "")
+    return TEMPLATES[Reason(int(code))].format(**decision)
+
+
+def with_reasons(df):
+    """Copy of a decisions DataFrame with a rendered `reason` column (use on the rows being shown)"""
+    if "reason_code" not in df.columns or "reason" in df.columns:
+        return df
+    out = df.copy()
+    out["reason"] = [reason_text(r) for r in out.to_dict("records")]
+    return out
+
+
+# ---------------- Sinks ----------------
+# A sink is anything with append(decision). Schedulers also call
+# sink.want(ready_count) when present and skip building the decision dict
+# when it returns False, so sampling bounds the XAI cost, not just storage.
+class Sampled:
+    """Forward every `every`-th decision, optionally only contested ones (more than one ready candidate)"""
+
+    def __init__(self, sink, every=1, contested_only=False):
+        self.sink, self.every, self.contested_only = sink, max(int(every), 1), contested_only
+        self.seen = self.kept = 0
+
+    def want(self, ready_count):
+        if self.contested_only and ready_count < 2:
+            return False
+        self.seen += 1
+        return (self.seen - 1) % self.every == 0
+
+    def append(self, decision):
+        self.kept += 1
+        self.sink.append(decision)
+
+
+class Discard:
+    """Sink for runs that need no decision log (sweeps): nothing is built"""
+
+    def want(self, ready_count):
+        return False
+
+    def append(self, decision):
+        pass
+
+
+def sample(sink, every=1, contested_only=False):
+    """Wrap `sink` in Sampled unless no sampling was requested"""
+    if every <= 1 and not contested_only:
+        return sink
+    return Sampled(sink, every, contested_only)
+
+
+# ---------------- Writer ----------------
+_INT_FIELDS = {"reason_code", "ready_count", "queue_position", "priority"}
+
+
+class DecisionWriter:
+    """Streams decisions to Parquet (row group per `batch_rows`) or CSV without holding the log in memory.
+
+    Columns are fixed when the first batch is written: that batch's keys
+    plus every REASON_FIELDS entry of the reason codes in it (or of
+    `reasons`, if given), so a field that only appears in later rows still
+    has a column. A later row with a field outside those columns raises
+    ValueError rather than being dropped. Numeric fields other than the
+    small integer ones are stored as float64 so integer and fractional
+    times can mix within one file.
+    """
+
+    def __init__(self, path, batch_rows=65_536, reasons=()):
+        self.path, self.batch_rows = path, batch_rows
+        self.reasons = tuple(Reason(r) for r in reasons)
+        self.count = 0
+        self._rows, self._writer, self._schema, self._fh = [], None, None, None
+        self._columns = None
+
+    def append(self, decision):
+        self._rows.append(decision)
+        self.count += 1
+        if len(self._rows) >= self.batch_rows:
+            self.flush()
+
+    def write_all(self, decisions):
+        """Drain a decision iterator/generator into the file"""
+        for d in decisions:
+            self.append(d)
+        return self
+
+    def flush(self):
+        if not self._rows:
+            return
+        if self._columns is None:
+            self._columns = self._declare(self._rows)
+        extra = set().union(*self._rows) - self._columns.keys()
+        if extra:
+            self._rows = []  # the batch is rejected, not retried on close()
+            raise ValueError(f"decision fields {sorted(extra)} are not columns of {self.path}; "
+                             "declare their reason codes with DecisionWriter(..., reasons=...)")
+        if self.path.endswith(".parquet"):
+            self._flush_parquet()
+        else:
+            self._flush_csv()
+        self._rows = []
+
+    def _declare(self, rows):
+        """Column names (dict, in order) of the first batch's keys plus its reason codes' declared fields"""
+        columns = dict.fromkeys(rows[0])
+        columns.update(dict.fromkeys(sorted(set().union(*rows) - columns.keys())))
+        codes = set(self.reasons) | {Reason(int(r["reason_code"])) for r in rows if r.get("reason_code") is not None}
+        for code in sorted(codes):
+            columns.update(dict.fromkeys(REASON_FIELDS[code]))
+        return columns
+
+    def _flush_parquet(self):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        if self._schema is None:
+            inferred = {f.name: f.type for f in pa.Table.from_pylist(self._rows).schema}
+            fields = []
+            for name in self._columns:
+                kind = inferred.get(name)
+                if kind is None or pa.types.is_null(kind):  # declared but not in the first batch
+                    kind = pa.int64() if name in _INT_FIELDS else pa.float64()
+                elif pa.types.is_integer(kind) and name not in _INT_FIELDS:
+                    kind = pa.float64()
+                fields.append(pa.field(name, kind))
+            self._schema = pa.schema(fields)
+            self._writer = pq.ParquetWriter(self.path, self._schema)
+        self._writer.write_table(pa.Table.from_pylist(self._rows, schema=self._schema))
+
+    def _flush_csv(self):
+        if self._writer is None:
+            self._fh = open(self.path, "w", newline="", encoding="utf-8")
+            self._writer = csv.DictWriter(self._fh, fieldnames=list(self._columns))
+            self._writer.writeheader()
+        self._writer.writerows(self._rows)
+
+    def close(self):
+        self.flush()
+        if self._writer is not None and self._fh is None:
+            self._writer.close()
+        if self._fh is not None:
+            self._fh.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,31 @@
+# tabs/ — One module per dashboard view, imported the first time its tab is opened
+import importlib
+import sys
+
+from diagnostics import span
+
+# Sidebar label -> (module, render function)
+TABS = {
+    "🖥️ Live System Scheduler (AI-Powered)": ("tabs.live", "render"),
+    "📊 Individual Algorithm Log": ("tabs.logs", "render_log"),
+    "📈 Algorithm Comparison": ("tabs.logs", "render_comparison"),
+    "🧮 Memory & Paging (Hit Ratio / Page Faults)": ("tabs.memory", "render"),
+    "💿 Disk Scheduling Simulator": ("tabs.disk", "render"),
+    "🧪 3D CPU Pulse": ("tabs.pulse", "render"),
+    "🛠️ Optimizer (Make Code Simpler & Faster)": ("tabs.optimizer", "render"),
+    "🧰 Offline Code Sandbox": ("tabs.code_sandbox", "render"),
+}
+TAB_MODULES = list(dict.fromkeys(mod for mod, _ in TABS.values()))
+
+
+def load(module):
+    """Import a tab module; the first import (and its dependencies) is recorded as an 'import · <module>' span"""
+    if module in sys.modules:
+        return sys.modules[module]
+    with span(f"import · {module}"):
+        return importlib.import_module(module)
+
+
+def render(label):
+    module, func = TABS[label]
+    getattr(load(module), func)()
@@ -0,0 +1,46 @@
+# tabs/code_sandbox.py — "Offline Code Sandbox" tab
+import time
+
+import streamlit as st
+
+import sandbox  # warm subprocess pool, shared by all sessions
+from diagnostics import span
+
+
+def render():
+    st.subheader("🧰 Offline Code Sandbox (local-only)")
+    st.caption("Run Python locally in an isolated subprocess. For other languages, save code to files (download) — execution requires local compilers.")
+    lang = st.selectbox("Language", ["Python","C","C++","Java","JavaScript","Go","Rust","Kotlin","Swift","Bash","HTML","CSS","SQL","Other"], key="sb_lang")
+    code = st.text_area("Code", height=260, key="sb_code", placeholder="# Write your code here...")
+    l1, l2, l3 = st.columns(3)
+    cpu_limit = l1.number_input("CPU limit (s)", 1, 60, 5, key="sb_cpu")
+    mem_limit = l2.number_input("Memory limit (MB)", 64, 4096, 512, step=64, key="sb_mem")
+    wall_limit = l3.number_input("Wall-clock timeout (s)", 1, 120, 10, key="sb_wall")
+    colA, colB, colC = st.columns([1,1,1])
+    run_py = colA.button("▶️ Run (Python only)", key="sb_run")
+    dl = colB.button("⬇️ Download File", key="sb_dl")
+    clr = colC.button("🧹 Clear", key="sb_clear")
+    if run_py and lang=="Python":
+        with st.spinner("Running in sandbox…"), span("sandbox.run"):
+            res = sandbox.get_pool().run(code, cpu_seconds=cpu_limit, memory_mb=mem_limit, timeout=wall_limit)
+        if res["status"] == "ok":
+            st.success(f"✅ Output ({res['wall_s']:.2f}s)")
+            st.code(res["stdout"] or "(no output)", language="bash")
+        else:
+            labels = {"error": "❌ Runtime Error", "timeout": f"⏱ Timed out after {wall_limit}s",
+                      "cpu_limit": f"🔥 CPU limit ({cpu_limit}s) exceeded",
+                      "memory_limit": f"💾 Memory limit ({mem_limit} MB) exceeded",
+                      "output_limit": "📜 Output limit exceeded — process stopped",
+                      "killed": f"💥 Killed by signal {-res['returncode']}"}
+            st.error(labels[res["status"]])
+            if res["stdout"]:
+                st.code(res["stdout"], language="bash")
+            if res["stderr"]:
+                st.code(res["stderr"], language="python")
+    if dl:
+        ext_map = {"Python":"py","C":"c","C++":"cpp","Java":"java","JavaScript":"js","Go":"go","Rust":"rs","Kotlin":"kt",
+                   "Swift":"swift","Bash":"sh","HTML":"html","CSS":"css","SQL":"sql","Other":"txt"}
+        fn = f"sandbox_snippet.{ext_map.get(lang,'txt')}"
+        st.download_button("Save Code", code.encode("utf-8"), file_name=fn, mime="text/plain", key=f"dl_code_{time.time()}")
+    if clr:
+        st.session_state["sb_code"] = ""
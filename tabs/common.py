@@ -0,0 +1,12 @@
+# tabs/common.py — Widgets and state shared by several dashboard tabs
+import streamlit as st
+
+from simulation.run_store import RunStore  # Parquet runs + manifest written by main.py
+
+run_store = RunStore("runs")
+
+
+def kpi(col, label, value, help_txt=None):
+    with col:
+        st.markdown(f"<div class='glass kpi'><div class='small'>{label}</div><div style='font-size:1.6rem'>{value}</div></div>", unsafe_allow_html=True)
+        if help_txt: st.caption(help_txt)
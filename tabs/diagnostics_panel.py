@@ -0,0 +1,46 @@
+# tabs/diagnostics_panel.py — Optional diagnostics panel: span table, histogram, exports
+import time
+
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+import diagnostics
+from tabs import TAB_MODULES
+
+
+def render(recorder):
+    """Span table, histogram and exports; shown below the active tab when the sidebar toggle is on"""
+    st.markdown("---")
+    st.subheader("🩺 Diagnostics")
+    stats = pd.DataFrame(recorder.stats())
+    if stats.empty:
+        st.info("No spans recorded yet.")
+    else:
+        st.dataframe(stats.sort_values("p95_ms", ascending=False), use_container_width=True, height=300)
+        name = st.selectbox("Histogram for span", stats["span"], key="diag_span")
+        counts, edges = recorder.histogram(name)
+        fig = go.Figure(go.Bar(x=[f"{lo:.2f}–{hi:.2f}" for lo, hi in zip(edges[:-1], edges[1:])], y=counts,
+                               marker_color='#00e5ff'))
+        fig.update_layout(template='plotly_dark', height=300, title=f"{name} (last {recorder.window} samples)",
+                          xaxis_title="ms", yaxis_title="count")
+        st.plotly_chart(fig, use_container_width=True, key="diag_hist")
+    c1, c2, c3 = st.columns(3)
+    c1.download_button("⬇️ Spans (JSON)", recorder.to_json().encode("utf-8"),
+                       file_name=f"spans_{int(time.time())}.json", mime="application/json", key="diag_json")
+    if "diag_pstats" in st.session_state:
+        c2.download_button("⬇️ Last profile (.pstats)", st.session_state["diag_pstats"],
+                           file_name=f"xai_dashboard_{int(time.time())}.pstats", mime="application/octet-stream",
+                           key="diag_pstats_dl")
+    if c3.button("Reset spans", key="diag_reset"):
+        recorder.reset()
+    if "diag_pstats" in st.session_state:
+        with st.expander("Top functions (cumulative time)"):
+            st.code(diagnostics.profile_summary(st.session_state["diag_pstats"]), language="text")
+
+    # Import cost of each tab in a fresh interpreter (what a cold server pays on first visit)
+    if st.button("Measure cold import time per tab", key="diag_imports"):
+        with st.spinner("Spawning interpreters…"):
+            st.session_state["diag_import_times"] = diagnostics.measure_imports(["streamlit"] + list(TAB_MODULES))
+    if "diag_import_times" in st.session_state:
+        st.dataframe(pd.DataFrame(st.session_state["diag_import_times"]), use_container_width=True)
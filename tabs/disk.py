@@ -0,0 +1,38 @@
+# tabs/disk.py — "Disk Scheduling Simulator" tab
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from diagnostics import span
+from simulation import disk  # FCFS / SSTF / SCAN / C-SCAN / LOOK / C-LOOK
+from tabs.common import kpi
+
+
+def render():
+    st.subheader("💿 Disk Head Scheduling (FCFS / SSTF / SCAN / C-SCAN / LOOK / C-LOOK)")
+    seq_str = st.text_input("Request Sequence (space-separated)", "98 183 37 122 14 124 65 67", key="req_seq")
+    max_cyl = st.number_input("Max Cylinder", 1, 1_000_000, 199, key="max_cyl")
+    start_head = st.number_input("Start Head", 0, int(max_cyl), min(53, int(max_cyl)), key="start_head")
+    algo = st.selectbox("Policy", list(disk.POLICIES), key="disk_algo")
+    direction = st.selectbox("Initial Direction (for SCAN/C-SCAN/LOOK/C-LOOK)", ["up","down"], key="disk_dir")
+    run = st.button("Run Disk Scheduling", key="run_disk")
+    if run:
+        try:
+            reqs = [int(x) for x in seq_str.strip().split()]
+            with span("disk.schedule"):
+                path, order, total = disk.disk_schedule(reqs, start_head, algo, direction, max_cyl=int(max_cyl))
+            c1,c2 = st.columns(2)
+            kpi(c1, "🔧 Total Head Movement", total, "lower is better")
+            kpi(c2, "📦 Requests Served", len(order))
+            st.markdown("<div class='glass'>", unsafe_allow_html=True)
+            st.dataframe(pd.DataFrame({"Sequence":order}), use_container_width=True, height=220)
+            st.markdown("</div>", unsafe_allow_html=True)
+            # head path, including edge visits for SCAN / C-SCAN
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(x=path, y=np.arange(len(path)), mode="lines+markers", line=dict(width=3), name="Head Path"))
+            fig.update_layout(template='plotly_dark', height=420, title="Disk Head Movement (cylinder vs step)",
+                              xaxis_title="Cylinder", yaxis_title="Step", xaxis_range=[0, int(max_cyl)])
+            st.plotly_chart(fig, use_container_width=True)
+        except Exception as e:
+            st.error(f"Bad input: {e}")
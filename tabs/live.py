@@ -0,0 +1,136 @@
+# tabs/live.py — "Live System Scheduler" tab: sampled processes, scheduling, anomaly flags
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+import diagnostics
+import live_scheduler  # get_live_processes(), simulate_scheduler(), system_stats()
+from anomaly_detector import AnomalyService  # cached IsolationForest over a sliding window (sklearn loads on first fit)
+from diagnostics import span
+from simulation.gantt import segments_xy, spread
+from simulation.schedule import perf_from_schedule
+from simulation.xai import with_reasons
+from tabs.common import kpi
+
+
+def render():
+    st.subheader("🖥️ Real-Time Explainable Scheduling with Anomaly Detection")
+    with st.container():
+        left, mid, right = st.columns([1,1,1])
+        algo = left.selectbox("Algorithm", list(live_scheduler.LIVE_ALGOS), key="live_algo")
+        refresh_rate = mid.slider("Auto-refresh (s)", 3, 20, 7, key="live_refresh")
+        contam = right.slider("Anomaly sensitivity (contamination)", 0.01, 0.5, 0.2, 0.01, key="live_contam")
+    features_choice = st.multiselect("Features for anomaly detection", ["waiting","turnaround"], default=["waiting","turnaround"], key="live_feats")
+    auto_refresh = st.toggle("🔁 Auto-refresh", value=True, key="live_autorefresh")
+
+    @st.cache_resource(show_spinner=False)
+    def anomaly_service(algo, features, contamination):
+        """One shared scorer per algorithm, feature set and contamination, reused across reruns and sessions.
+
+        Keyed on the algorithm too: the service dedups by sampler stamp, so a
+        shared one would keep only the first algorithm's rows for each stamp.
+        """
+        return AnomalyService(list(features), contamination=contamination)
+
+    def live_data():
+        """Recompute the live frame only when the sampler publishes a new snapshot or inputs change"""
+        key = (live_scheduler.get_sampler().stamp(), algo, contam, tuple(features_choice))
+        cache = st.session_state.get("live_cache")
+        if cache is not None and cache["key"] == key:
+            return cache
+        with st.spinner("Fetching live system data…"):
+            with span("live.processes"):
+                procs = live_scheduler.get_live_processes(limit=12)
+            with span("live.schedule"):
+                sched, decisions = live_scheduler.simulate_scheduler(procs, algo=algo)
+            with span("live.frame"):
+                df = sched.to_pandas()
+
+            stats = live_scheduler.system_stats()  # shared background sampler, no blocking
+            cpu, mem_pct = stats["cpu"], stats["mem"]
+
+            # anomaly detect (persistent model, refit on a sliding window)
+            df["anomaly"] = "Normal"
+            if not df.empty and len(features_choice) > 0:
+                try:
+                    service = anomaly_service(algo, tuple(features_choice), contam)
+                    with span("live.anomaly"):
+                        df["anomaly"], df["anomaly_score"] = service.update(df, stamp=key[0])
+                except Exception:
+                    df["anomaly"] = "Normal"
+        with span("live.kpis"):
+            pf = perf_from_schedule(sched)
+        cache = {"key": key, "df": df, "decisions": decisions, "pf": pf, "cpu": cpu, "mem": mem_pct}
+        st.session_state["live_cache"] = cache
+        return cache
+
+    @diagnostics.timed("live.figures")
+    def live_figures(df, cpu, mem_pct):
+        """Build the Plotly figures once per session, then patch their trace data in place"""
+        figs = st.session_state.get("live_figs")
+        if figs is None:
+            gantt = go.Figure([go.Scattergl(name=label, mode="lines", line=dict(color=color, width=14),
+                                            hovertemplate="%{text}<extra></extra>")
+                               for label, color in (("Normal", '#00e5ff'), ("Anomaly", '#ff4d4f'))])
+            gantt.update_yaxes(autorange="reversed", type="category")
+            gantt.update_layout(height=420, title_x=0.2, template='plotly_dark', xaxis_title="CPU seconds")
+            util = go.Figure(go.Bar(x=["CPU %", "Memory %"], y=[0, 0], marker_color=['#00e5ff', '#7fff00']))
+            util.update_layout(template='plotly_dark', height=280, yaxis_range=[0, 100], title="Current Utilization")
+            figs = st.session_state["live_figs"] = {"gantt": gantt, "util": util}
+        with figs["gantt"].batch_update():
+            for trace in figs["gantt"].data:
+                part = df[df["anomaly"] == trace.name]
+                x, y = segments_xy(part["pid"].astype(str).to_numpy(object), part["start"].to_numpy(), part["finish"].to_numpy())
+                trace.update(x=x, y=y, text=spread(part["name"].to_numpy(object)))
+            figs["gantt"].layout.title.text = f"Live Process Scheduling — {algo.upper()} (Anomalies Highlighted)"
+        figs["util"].data[0].y = [cpu, mem_pct]
+        return figs
+
+    # Fragment reruns on its own timer; the rest of the page (and other widgets) stay responsive
+    @st.fragment(run_every=refresh_rate if auto_refresh else None)
+    def live_panel():
+        data = live_data()
+        df, pf, cpu, mem_pct = data["df"], data["pf"], data["cpu"], data["mem"]
+
+        # KPIs
+        c1, c2, c3, c4 = st.columns(4)
+        kpi(c1, "🧠 CPU Usage", f"{cpu:.1f}%")
+        kpi(c2, "💾 Memory", f"{mem_pct:.1f}%")
+        kpi(c3, "⏱ Avg Waiting", f"{pf.get('avg_wait', np.nan):.2f}" if 'avg_wait' in pf else "–")
+        kpi(c4, "📈 Throughput", f"{pf.get('throughput', np.nan):.2f}/s" if 'throughput' in pf else "–")
+
+        with span("live.tables"):
+            st.markdown("<div class='glass'>", unsafe_allow_html=True)
+            st.dataframe(df, use_container_width=True, height=260)
+            st.markdown("</div>", unsafe_allow_html=True)
+            with st.expander("🧾 Scheduler decisions (XAI)"):
+                st.dataframe(with_reasons(pd.DataFrame(data["decisions"])), use_container_width=True, height=220)
+
+        figs = live_figures(df, cpu, mem_pct)
+        with span("live.plotly"):  # figure serialization happens inside st.plotly_chart
+            if not df.empty:
+                st.plotly_chart(figs["gantt"], use_container_width=True, key="live_gantt")
+
+            st.subheader("System Utilization")
+            st.plotly_chart(figs["util"], use_container_width=True, key="live_util")
+
+        # anomalies extract
+        if "Anomaly" in df["anomaly"].values:
+            st.warning("⚠️ Anomalies detected — high waiting/turnaround.")
+            bad = df[df["anomaly"]=="Anomaly"][["pid","name","waiting","turnaround","start","finish"]]
+            st.dataframe(bad, use_container_width=True)
+            csv = bad.to_csv(index=False).encode("utf-8")
+            st.download_button(
+                "⬇️ Download anomalies (CSV)",
+                data=csv, file_name=f"anomalies_{int(time.time())}.csv",
+                mime="text/csv", key="dl_anom"
+            )
+        else:
+            st.success("✅ No anomalies in this cycle.")
+
+        st.caption("Tip: lower contamination → fewer flags (higher precision).")
+
+    live_panel()
@@ -0,0 +1,272 @@
+# tabs/logs.py — "Individual Algorithm Log" and "Algorithm Comparison" tabs (run store + legacy CSVs)
+import glob
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+import diagnostics
+from diagnostics import span
+from simulation import gantt  # merged / bucketed WebGL timelines
+from simulation.cpu_scheduler import LABELS
+from simulation.schedule import perf_from_schedule, read_schedule  # vectorized KPIs (ScheduleLog or DataFrame)
+from simulation.xai import with_reasons  # reason codes -> text, for displayed rows only
+from tabs.common import kpi, run_store
+
+# ---------------- Cached loaders ----------------
+# Every loader takes (path, mtime_ns, size) from file_stamp(), so a rerun
+# reuses the parsed table / built figure until the file on disk changes.
+PAGE_ROWS = 5_000        # tables longer than this are shown one page at a time
+CSV_CHUNK = 65_536       # raw CSV rows per index block (Parquet uses its row groups)
+
+def file_stamp(path):
+    try:
+        st_ = os.stat(path)
+    except OSError:
+        return path, None, None
+    return path, st_.st_mtime_ns, st_.st_size
+
+# cache_resource, not cache_data: a hit hands back the same DataFrame instead of
+# unpickling a copy of the whole schedule on every rerun. Callers treat it as read-only.
+# Decision logs, which can be far larger, are never loaded whole: see table_index / load_page.
+@st.cache_resource(show_spinner="Loading…", max_entries=8)
+def load_table(path, mtime, size, column=None, values=()):
+    """Whole Parquet or CSV table as a shared, read-only DataFrame (schedules: Gantt + KPIs need every slice);
+    `values` keeps rows whose `column` is in it (pushed down for Parquet)"""
+    if mtime is None:
+        return pd.DataFrame()
+    with span("log.load"):  # cache misses only
+        if path.endswith(".parquet"):
+            import pyarrow.parquet as pq
+            has_col = column in pq.read_schema(path).names
+            return read_schedule(path, filters=[(column, "in", list(values))] if values and has_col else None)
+        df = pd.read_csv(path)
+        if values and column in df.columns:
+            df = df[df[column].astype(str).isin(values)].reset_index(drop=True)
+        return df
+
+def _chunks(path, start=0, columns=None):
+    """DataFrames of index block `start` onward: Parquet row groups, or CSV_CHUNK-row slices of a CSV"""
+    if path.endswith(".parquet"):
+        import pyarrow.parquet as pq
+        pf = pq.ParquetFile(path)
+        for i in range(start, pf.num_row_groups):
+            yield pf.read_row_group(i, columns=columns).to_pandas()
+    else:
+        yield from pd.read_csv(path, usecols=columns, skiprows=range(1, start * CSV_CHUNK + 1), chunksize=CSV_CHUNK)
+
+def _keep(df, column, values):
+    return df[df[column].astype(str).isin(values)] if values and column in df.columns else df
+
+@st.cache_data(show_spinner="Indexing…", max_entries=32)
+def table_index(path, mtime, size, column=None, values=()):
+    """Column names plus rows per index block after the `values` filter.
+
+    Unfiltered Parquet counts come straight from the footer; a filter reads
+    only `column`. The table itself is never materialised.
+    """
+    if mtime is None:
+        return {"columns": [], "counts": np.zeros(0, dtype=np.int64)}
+    with span("log.index"):
+        if path.endswith(".parquet"):
+            import pyarrow.parquet as pq
+            pf = pq.ParquetFile(path)
+            columns = pf.schema_arrow.names
+            if not (values and column in columns):
+                counts = [pf.metadata.row_group(i).num_rows for i in range(pf.num_row_groups)]
+                return {"columns": columns, "counts": np.asarray(counts, dtype=np.int64)}
+        else:
+            columns = pd.read_csv(path, nrows=0).columns.tolist()
+        key = [column] if values and column in columns else columns[:1]
+        counts = [len(_keep(chunk, column, values)) for chunk in _chunks(path, columns=key)]
+        return {"columns": columns, "counts": np.asarray(counts, dtype=np.int64)}
+
+@st.cache_data(show_spinner="Loading…", max_entries=16)
+def load_page(path, mtime, size, page, column=None, values=()):
+    """Rows [page * PAGE_ROWS, (page + 1) * PAGE_ROWS) of the filtered table, reading only the blocks that hold them"""
+    counts = table_index(path, mtime, size, column, values)["counts"]
+    ends = np.cumsum(counts)
+    offset = page * PAGE_ROWS
+    if offset >= (ends[-1] if len(ends) else 0):
+        return pd.DataFrame(columns=table_index(path, mtime, size, column, values)["columns"])
+    first = int(np.searchsorted(ends, offset, side="right"))
+    skip = offset - (int(ends[first - 1]) if first else 0)
+    parts, need = [], PAGE_ROWS
+    with span("log.page"):
+        for chunk in _chunks(path, first):
+            chunk = _keep(chunk, column, values).iloc[skip:skip + need]
+            skip = 0
+            parts.append(chunk)
+            need -= len(chunk)
+            if need <= 0:
+                break
+    return pd.concat(parts, ignore_index=True)
+
+def page_selector(total, key):
+    """0-based page chosen with a selector, or 0 when `total` rows fit on one page"""
+    if total <= PAGE_ROWS:
+        return 0
+    pages = -(-total // PAGE_ROWS)
+    return st.number_input(f"Page (of {pages:,}, {PAGE_ROWS:,} rows each)", 1, pages, 1, key=key) - 1
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def load_manifest(path, mtime, size):
+    return run_store.runs() if mtime is not None else []
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def schedule_kpis(path, mtime, size, values=()):
+    return perf_from_schedule(load_table(path, mtime, size, column="pid", values=values))
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+@diagnostics.timed("gantt.prepare")
+def gantt_data(path, mtime, size, values=(), by="pid"):
+    """Lanes + merged slices of one schedule file (numpy arrays, shared by every window drawn from it)"""
+    return gantt.prepare(load_table(path, mtime, size, column="pid", values=values), by=by)
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+@diagnostics.timed("gantt.figure")
+def gantt_chart(stamps, window, values=(), by="pid"):
+    """WebGL timeline of [(name, path, mtime, size), ...] on a shared time axis, for one zoom window"""
+    runs = [(name, gantt_data(path, mtime, size, values, by)) for name, path, mtime, size in stamps]
+    return gantt.gantt_figure(runs, *window)
+
+def time_window(stamps, key, values=(), by="pid"):
+    """Zoom slider over the runs' combined time span; the chart is rebuilt (and re-bucketed) per window"""
+    datas = [gantt_data(*stamp[1:], values, by) for stamp in stamps]
+    lo, hi = min(d["t_min"] for d in datas), max(d["t_max"] for d in datas)
+    if hi <= lo:
+        return lo, hi
+    # the span is part of the key so a different run selection starts fully zoomed out
+    return st.slider("Time window (zoom)", lo, hi, (lo, hi), step=(hi - lo) / 1000, key=f"{key}_{lo:g}_{hi:g}")
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+@diagnostics.timed("compare.build")
+def comparison_view(path, mtime, size, latest=True, workload=None):
+    """Summary table (run store manifest, restricted to one workload, or legacy performance_summary.csv) plus its bar charts"""
+    if mtime is None:
+        df = pd.DataFrame()
+    elif path == run_store.manifest:
+        df = run_store.summary(latest_only=latest, workload=workload)
+    else:
+        df = pd.read_csv(path)
+    figs = []
+    for metric in ["Average Waiting Time","Average Turnaround Time","CPU Utilization (%)","Throughput"]:
+        if metric in df.columns:
+            fig = px.bar(df, x="Algorithm", y=metric, color="Algorithm", title=f"{metric} Comparison")
+            fig.update_layout(template='plotly_dark', height=360)
+            figs.append(fig)
+    return df, figs
+
+def paginate(df, key):
+    """Whole frame when small, otherwise one PAGE_ROWS slice chosen with a page selector"""
+    page = page_selector(len(df), key)
+    return df.iloc[page * PAGE_ROWS: (page + 1) * PAGE_ROWS]
+
+def render_log():
+    st.subheader("📂 Decision Logs (per algorithm)")
+    st.write("Loaded from:", os.path.abspath(run_store.root))
+    st.write("Last refreshed:", time.ctime())
+    runs = {f"{r['label']} • {r['run_id']}": r["run_id"] for r in reversed(load_manifest(*file_stamp(run_store.manifest)))}
+    legacy = sorted(glob.glob("*_xai_decisions.csv"))  # pre-run-store CSV output
+    options = list(runs) + legacy
+    if not options:
+        st.warning("No runs found. Run main.py first.")
+    else:
+        f = st.selectbox("Select a run", options, key="log_file")
+        pid_filter = st.text_input("Filter by chosen pid (comma-separated, optional)", "", key="log_pids")
+        pids = tuple(x.strip() for x in pid_filter.split(",") if x.strip())
+        try:
+            if f in runs:
+                dec_path, sched_path = run_store.path(runs[f], "decisions"), run_store.path(runs[f], "schedule")
+            else:
+                dec_path, sched_path = f, f.replace("_xai_decisions.csv", "_log.csv")
+                if not os.path.exists(sched_path):
+                    sched_path = f
+            dec = file_stamp(dec_path)
+            total = int(table_index(*dec, column="pid_chosen", values=pids)["counts"].sum())
+            page = page_selector(total, "log_page")
+            st.markdown("<div class='glass'>", unsafe_allow_html=True)
+            st.dataframe(with_reasons(load_page(*dec, page, column="pid_chosen", values=pids)),
+                         use_container_width=True, height=380)
+            st.markdown("</div>", unsafe_allow_html=True)
+
+            sched_cols = table_index(*file_stamp(sched_path))["columns"]
+            if {'start','finish','pid'}.issubset(sched_cols):
+                by = "core" if "core" in sched_cols and st.toggle("One lane per core", key="log_by_core") else "pid"
+                stamps = (("Process Execution Timeline", *file_stamp(sched_path)),)
+                window = time_window(stamps, "log_window", pids, by)
+                st.plotly_chart(gantt_chart(stamps, window, pids, by), use_container_width=True)
+
+            pf = schedule_kpis(*file_stamp(sched_path), values=pids)
+            c1,c2,c3 = st.columns(3)
+            kpi(c1,"Avg Waiting", f"{pf.get('avg_wait',np.nan):.2f}" if 'avg_wait' in pf else "–")
+            kpi(c2,"Avg Turnaround", f"{pf.get('avg_tat',np.nan):.2f}" if 'avg_tat' in pf else "–")
+            kpi(c3,"Throughput", f"{pf.get('throughput',np.nan):.2f}/s" if 'throughput' in pf else "–")
+        except Exception as e:
+            st.error(f"Could not load: {e}")
+
+
+def render_comparison():
+    st.subheader("🏁 Comparative Analytics")
+    latest = st.toggle("Latest run per algorithm only", value=True, key="cmp_latest")
+    stamp = file_stamp(run_store.manifest)
+    workload = None
+    if stamp[1] is None:
+        stamp = file_stamp("performance_summary.csv")  # pre-run-store summary
+    else:
+        # metrics only compare on a shared workload, so the charts show one at a time
+        workloads = run_store.workloads()
+        if workloads:
+            workload = st.selectbox("Workload", workloads, format_func=workload_name, key="cmp_workload")
+    df, figs = comparison_view(*stamp, latest=latest, workload=workload)
+    if df.empty:
+        st.warning("No runs recorded yet. Run main.py first.")
+    else:
+        st.markdown("<div class='glass'>", unsafe_allow_html=True)
+        st.dataframe(paginate(df, "cmp_page"), use_container_width=True)
+        st.markdown("</div>", unsafe_allow_html=True)
+        for i, fig in enumerate(figs):
+            st.plotly_chart(fig, use_container_width=True, key=f"cmp_fig_{i}")
+        render_timelines(df)
+
+
+def workload_name(key):
+    spec, seed, cores = key
+    parts = [str(spec)]
+    if seed is not None and spec != "default":
+        parts.append(f"seed {seed}")
+    if cores is not None:
+        parts.append(f"{cores} core{'s' if cores != 1 else ''}")
+    return " · ".join(parts)
+
+
+def legacy_log(label):
+    """{algo}_log.csv written for a performance_summary.csv row, if it exists"""
+    algo = "rr" if label.startswith("Round Robin") else {v: k for k, v in LABELS.items()}.get(label)
+    path = f"{algo}_log.csv"
+    return path if algo and os.path.exists(path) else None
+
+
+def render_timelines(df):
+    """Schedules of the selected runs stacked on one shared, zoomable time axis"""
+    st.subheader("🕒 Timelines on a shared time axis")
+    if "run_id" in df.columns:
+        sources = {f"{r.Algorithm} • {r.run_id}": run_store.path(r.run_id, "schedule") for r in df.itertuples()}
+    else:
+        sources = {label: legacy_log(label) for label in df["Algorithm"].drop_duplicates()}
+    sources = {k: v for k, v in sources.items() if v and os.path.exists(v)}
+    if not sources:
+        st.info("No stored schedules to draw.")
+        return
+    chosen = st.multiselect("Runs", list(sources), default=list(sources)[:3], key="cmp_runs")
+    if not chosen:
+        return
+    stamps = tuple((name, *file_stamp(sources[name])) for name in chosen)
+    try:
+        window = time_window(stamps, "cmp_window")
+        st.plotly_chart(gantt_chart(stamps, window), use_container_width=True, key="cmp_gantt")
+    except Exception as e:
+        st.error(f"Could not draw timelines: {e}")
@@ -0,0 +1,56 @@
+# tabs/memory.py — "Memory & Paging" tab
+import io
+
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from diagnostics import span
+from simulation import paging  # FIFO / LRU / Clock / LFU / OPT / ARC engine
+from tabs.common import kpi
+
+
+def render():
+    st.subheader("🧮 Paging Simulator (FIFO / LRU / Clock / LFU / OPT / ARC)")
+    ref_str = st.text_input("Reference String (space-separated)", "7 0 1 2 0 3 0 4 2 3 0 3 2", key="refstr")
+    ref_file = st.file_uploader("…or stream a reference file (whitespace/comma separated)", type=["txt","csv"], key="ref_file")
+    frames = st.slider("Frames", 1, 10, 3, key="frames")
+    algo = st.selectbox("Replacement Policy", list(paging.POLICIES), key="mem_algo")
+    sample_every = st.number_input("Timeline: keep every Nth reference", 1, 1_000_000, 1 if ref_file is None else 1000, key="mem_sample")
+    run = st.button("Run Simulation", key="run_paging")
+    if run:
+        try:
+            if ref_file is not None:
+                refs = paging.iter_refs(io.TextIOWrapper(ref_file, encoding="utf-8"))
+            else:
+                refs = [int(x) for x in ref_str.strip().split()]
+            with span("paging.simulate"):
+                tl, faults, hit_ratio = paging.simulate_paging(refs, frames, algo, sample_every=int(sample_every))
+            c1,c2 = st.columns(2)
+            kpi(c1,"📉 Page Faults", faults)
+            kpi(c2,"📈 Hit Ratio", f"{hit_ratio*100:.1f}%")
+            st.markdown("<div class='glass'>", unsafe_allow_html=True)
+            st.dataframe(pd.DataFrame(tl), use_container_width=True, height=320)
+            st.markdown("</div>", unsafe_allow_html=True)
+        except Exception as e:
+            st.error(f"Bad input: {e}")
+
+    # One stack-distance pass gives LRU's hit ratio for every frame count at once
+    if st.button("Hit ratio vs frames (LRU, one pass)", key="run_mrc"):
+        try:
+            if ref_file is not None:
+                ref_file.seek(0)
+                refs = paging.iter_refs(io.TextIOWrapper(ref_file, encoding="utf-8"))
+            else:
+                refs = [int(x) for x in ref_str.strip().split()]
+            with span("paging.mrc"):
+                curve = paging.lru_hit_ratio_curve(refs)
+            fig = go.Figure(go.Scatter(x=curve["frames"], y=curve["hit_ratio"] * 100, mode="lines", line=dict(width=3), name="LRU"))
+            if frames <= len(curve["frames"]):
+                fig.add_trace(go.Scatter(x=[frames], y=[curve["hit_ratio"][frames - 1] * 100], mode="markers",
+                                         marker=dict(size=12, color='#7fff00'), name=f"{frames} frames"))
+            fig.update_layout(template='plotly_dark', height=380, title="LRU Hit Ratio vs Frames (Mattson stack distance)",
+                              xaxis_title="Frames", yaxis_title="Hit ratio (%)")
+            st.plotly_chart(fig, use_container_width=True)
+        except Exception as e:
+            st.error(f"Bad input: {e}")
@@ -0,0 +1,32 @@
+# tabs/optimizer.py — "Optimizer" tab (static checklist)
+import streamlit as st
+
+
+def render():
+    st.subheader("🛠️ Practical Optimization Checklist")
+    st.markdown("""
+<div class='glass mono'>
+<b>Python / Streamlit Simplifications</b>
+1) Avoid repeated heavy computations in loops → cache models/data with <code>@st.cache_data</code> or <code>@st.cache_resource</code>.<br>
+2) Replace nested if/else with dict-based dispatch (cleaner + faster).<br>
+3) Vectorize with NumPy/Pandas; avoid per-row Python loops.<br>
+4) Precompute Plotly figures only when inputs change; reuse figure objects.<br>
+5) Reduce DataFrame size (astype('category'), float32); drop unused cols before display.<br>
+6) Use unique <code>key=</code> on widgets generated in loops to prevent Streamlit duplication errors.<br>
+7) For background-like updates, use timed reruns instead of blocking loops (<code>time.sleep</code> minimal).<br>
+8) Profile with <code>cProfile</code> & <code>snakeviz</code>; identify top hotspots. Track throughput / p99 latency with <code>python main.py bench --baseline bench_results.json</code>.<br>
+9) Separate UI (Streamlit) from logic (plain .py helpers) for testability and maintainability.<br>
+10) Keep functions pure (deterministic inputs→outputs) to simplify reasoning and caching.
+<br><br>
+<b>Memory Efficiency</b>
+• Use generators/yield for streams; <br>
+• Prefer lists of dicts → DataFrame once; <br>
+• Downcast numeric dtypes; <br>
+• Clear large objects (del / reassign) after use.
+<br><br>
+<b>Feasibility</b>
+• Keep dependencies minimal (psutil, pandas, numpy, plotly, sklearn).<br>
+• No internet required for theme/fonts; use system monospace fallback.<br>
+• Move simulators into <code>live_scheduler.py</code> or <code>simulation/</code> to keep UI file small.
+</div>
+""", unsafe_allow_html=True)
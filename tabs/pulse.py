@@ -0,0 +1,28 @@
+# tabs/pulse.py — "3D CPU Pulse" tab
+import numpy as np
+import plotly.graph_objects as go
+import psutil
+import streamlit as st
+
+
+def render():
+    st.subheader("🧪 3D CPU Pulse (reacts to live CPU usage)")
+    frames = st.slider("History Length", 20, 150, 60, key="pulse_len")
+    xs = list(range(frames))
+    ys = np.zeros(frames)
+    zs = np.zeros(frames)
+    for i in range(frames):
+        cpu = psutil.cpu_percent(interval=0.05)
+        ys[i] = np.sin(i/4) * (0.5 + cpu/200)  # amplitude up with CPU
+        zs[i] = cpu
+    fig = go.Figure(data=[go.Scatter3d(
+        x=xs, y=ys, z=zs, mode='lines',
+        line=dict(width=6, color=zs, colorscale='Viridis')
+    )])
+    fig.update_layout(template='plotly_dark', height=520,
+                      scene=dict(
+                        xaxis_title='Time step', yaxis_title='Pulse', zaxis_title='CPU %',
+                        camera=dict(eye=dict(x=1.6,y=1.6,z=1.2))
+                      ),
+                      title="Futuristic Pulse • color = CPU% • amplitude reacts to load")
+    st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,131 @@
+# tests/test_cpu_scheduler.py — Event-driven schedulers against textbook results and a tick-by-tick reference
+import numpy as np
+import pytest
+
+from simulation.cpu_scheduler import SCHEDULERS, run_algorithm
+from simulation.workload import DEFAULT_PROCESSES, generate_workload, iter_processes, load_workload
+from simulation.xai import Sampled
+
+
+def slices(log):
+    return [(r["pid"], r["start"], r["finish"]) for r in log]
+
+
+# ---------------- Demo workload ----------------
+@pytest.mark.parametrize("algo, expected", [
+    ("fcfs", [("P1", 0, 5), ("P2", 5, 8), ("P3", 8, 9)]),
+    ("sjf", [("P1", 0, 5), ("P3", 5, 6), ("P2", 6, 9)]),
+    # P2 arrives at 2 and queues ahead of the preempted P1
+    ("rr", [("P1", 0, 2), ("P2", 2, 4), ("P1", 4, 6), ("P3", 6, 7), ("P2", 7, 8), ("P1", 8, 9)]),
+    # equal remaining time never preempts
+    ("srtf", [("P1", 0, 5), ("P3", 5, 6), ("P2", 6, 9)]),
+    ("priority", [("P1", 0, 2), ("P2", 2, 5), ("P1", 5, 8), ("P3", 8, 9)]),
+])
+def test_demo_schedule(algo, expected):
+    log, _ = run_algorithm(algo, DEFAULT_PROCESSES, quantum=2)
+    assert slices(log) == expected
+
+
+@pytest.mark.parametrize("algo, avg_wait, avg_tat", [
+    ("fcfs", 7 / 3, 16 / 3), ("sjf", 5 / 3, 14 / 3), ("rr", 3.0, 6.0),
+])
+def test_demo_metrics(algo, avg_wait, avg_tat):
+    m = run_algorithm(algo, DEFAULT_PROCESSES, quantum=2)[0].metrics()
+    assert m["avg_wait"] == pytest.approx(avg_wait)
+    assert m["avg_tat"] == pytest.approx(avg_tat)
+    assert m["cpu_util"] == pytest.approx(100.0)
+    assert m["throughput"] == pytest.approx(3 / 9)
+
+
+# ---------------- Tick-by-tick reference ----------------
+def reference_finish(procs, algo, quantum=2):
+    """Completion time per process from a unit-step simulation (integer arrivals and bursts)"""
+    n = len(procs)
+    rem = [p["burst"] for p in procs]
+    finish = [None] * n
+    queue, cur, used, t = [], None, 0, 0
+    arrived = set()
+
+    def admit(now):
+        for i, p in enumerate(procs):
+            if i not in arrived and p["arrival"] <= now:
+                arrived.add(i)
+                queue.append(i)
+
+    admit(0)
+    while any(f is None for f in finish):
+        if cur is None and queue:
+            if algo == "fcfs" or algo == "rr":
+                cur = queue.pop(0)
+            elif algo == "sjf":
+                cur = min(queue, key=lambda i: (procs[i]["burst"], i)); queue.remove(cur)
+            elif algo == "srtf":
+                cur = min(queue, key=lambda i: (rem[i], i)); queue.remove(cur)
+            else:
+                cur = min(queue, key=lambda i: (procs[i]["priority"], i)); queue.remove(cur)
+            used = 0
+        t += 1
+        if cur is not None:
+            rem[cur] -= 1; used += 1
+        admit(t)
+        if cur is None:
+            continue
+        if rem[cur] == 0:
+            finish[cur], cur = t, None
+        elif algo == "rr" and used == quantum:
+            queue.append(cur); cur = None
+        elif algo == "srtf" and queue and min(rem[i] for i in queue) < rem[cur]:
+            queue.append(cur); cur = None
+        elif algo == "priority" and queue and min(procs[i]["priority"] for i in queue) < procs[cur]["priority"]:
+            queue.append(cur); cur = None
+    return finish
+
+
+def random_procs(rng, n):
+    arrival = np.sort(rng.integers(0, 3 * n, n))
+    return [{"pid": f"P{i}", "arrival": int(a), "burst": int(b), "priority": int(p)}
+            for i, (a, b, p) in enumerate(zip(arrival, rng.integers(1, 8, n), rng.integers(0, 4, n)))]
+
+
+@pytest.mark.parametrize("algo", sorted(SCHEDULERS))
+def test_matches_tick_reference(algo):
+    rng = np.random.default_rng(7)
+    for _ in range(200):
+        procs = random_procs(rng, int(rng.integers(1, 12)))
+        log, _ = run_algorithm(algo, procs, quantum=2)
+        got = np.zeros(len(procs))
+        np.maximum.at(got, log.pid_index, log.finish)
+        assert got.tolist() == reference_finish(procs, algo), procs
+
+
+@pytest.mark.parametrize("algo", sorted(SCHEDULERS))
+def test_slices_cover_bursts_without_overlap(algo):
+    cols = generate_workload(2_000, seed=3)
+    log, _ = run_algorithm(algo, iter_processes(cols), quantum=2)
+    order = np.argsort(log.start, kind="stable")
+    assert np.all(log.start[order][1:] >= log.finish[order][:-1] - 1e-9)
+    assert np.all(log.start >= log.arrival - 1e-9)
+    ran = np.bincount(log.pid_index, weights=log.finish - log.start)
+    assert np.allclose(ran, cols["burst"])
+
+
+def test_sampled_sink_keeps_every_nth_decision():
+    full = run_algorithm("rr", DEFAULT_PROCESSES, quantum=2)[1]
+    kept = []
+    run_algorithm("rr", DEFAULT_PROCESSES, quantum=2, decisions=Sampled(kept, every=2))
+    assert kept == full[::2]
+
+
+def test_zero_length_schedule_has_no_rates():
+    log, _ = run_algorithm("fcfs", [{"pid": "A", "arrival": 0, "burst": 0}])
+    assert set(log.metrics()) == {"avg_wait", "avg_tat"}
+
+
+@pytest.mark.parametrize("spec", ["random", "bursty-pareto", "random:", "poisson-exponential:lots"])
+def test_synthetic_spec_needs_a_count(spec):
+    with pytest.raises(ValueError, match=r"<n>"):
+        load_workload(spec)
+
+
+def test_synthetic_spec_count():
+    assert len(list(load_workload("bursty-pareto:1e3", seed=1))) == 1_000
@@ -0,0 +1,71 @@
+# tests/test_disk.py — Head scheduling on the textbook queue, batch vs arrivals-over-time
+import numpy as np
+import pytest
+
+from simulation.disk import POLICIES, disk_schedule, disk_schedule_dynamic
+
+QUEUE = [98, 183, 37, 122, 14, 124, 65, 67]
+
+
+@pytest.mark.parametrize("algo, direction, order, total", [
+    ("FCFS", "up", QUEUE, 640),
+    ("SSTF", "up", [65, 67, 37, 14, 98, 122, 124, 183], 236),
+    ("SCAN", "up", [65, 67, 98, 122, 124, 183, 37, 14], 331),
+    ("SCAN", "down", [37, 14, 65, 67, 98, 122, 124, 183], 236),
+    ("C-SCAN", "up", [65, 67, 98, 122, 124, 183, 14, 37], 382),   # the 199 -> 0 return counts
+    ("LOOK", "up", [65, 67, 98, 122, 124, 183, 37, 14], 299),
+    ("LOOK", "down", [37, 14, 65, 67, 98, 122, 124, 183], 208),
+    ("C-LOOK", "up", [65, 67, 98, 122, 124, 183, 14, 37], 322),
+])
+def test_textbook_queue(algo, direction, order, total):
+    path, got, moved = disk_schedule(QUEUE, 53, algo, direction)
+    assert got == order
+    assert moved == total
+    assert path[0] == 53
+
+
+@pytest.mark.parametrize("algo", ["SCAN", "C-SCAN", "LOOK", "C-LOOK"])
+@pytest.mark.parametrize("direction", ["up", "down"])
+def test_request_on_start_cylinder_served_first(algo, direction):
+    assert disk_schedule([10, 53, 100], 53, algo, direction)[1][0] == 53
+
+
+def test_scan_edges_in_path():
+    assert disk_schedule(QUEUE, 53, "SCAN", "up")[0].tolist()[-3:] == [199, 37, 14]
+    assert disk_schedule(QUEUE, 53, "C-SCAN", "down")[0].tolist()[3:5] == [0, 199]
+    assert 199 not in disk_schedule([60, 70], 53, "SCAN", "up")[0].tolist()   # nothing behind: no turn
+
+
+def test_bad_arguments():
+    with pytest.raises(ValueError):
+        disk_schedule(QUEUE, 53, "ELEVATOR")
+    with pytest.raises(ValueError):
+        disk_schedule([250], 53, max_cyl=199)
+
+
+@pytest.mark.parametrize("algo", POLICIES)
+@pytest.mark.parametrize("direction", ["up", "down"])
+def test_dynamic_at_time_zero_matches_batch(algo, direction):
+    rng = np.random.default_rng(4)
+    for _ in range(100):
+        reqs = rng.integers(0, 200, int(rng.integers(1, 30)))
+        start = int(rng.integers(0, 200))
+        _, order, total = disk_schedule(reqs, start, algo, direction)
+        dyn = disk_schedule_dynamic(reqs, np.zeros(len(reqs)), start, algo, direction)
+        assert reqs[dyn["order"]].tolist() == order
+        assert dyn["total_movement"] == total
+
+
+def test_dynamic_timing():
+    res = disk_schedule_dynamic([100, 20], [0, 5], 50, "FCFS", seek_rate=2.0, service_time=1.0)
+    # 50 -> 100 takes 25, serve until 26; 100 -> 20 takes 40, serve until 67
+    assert res["order"].tolist() == [0, 1]
+    assert res["served_at"].tolist() == [26.0, 67.0]
+    assert res["latency"].tolist() == [26.0, 62.0]
+    assert res["total_movement"] == 130
+
+
+def test_dynamic_waits_for_late_arrivals():
+    res = disk_schedule_dynamic([10], [40.0], 10, "SSTF")
+    assert res["served_at"].tolist() == [40.0]
+    assert res["total_movement"] == 0
@@ -0,0 +1,90 @@
+# tests/test_gantt.py — Gantt preparation: lane bands, slice merging, bucketed occupancy
+import numpy as np
+import pytest
+
+from simulation.cpu_scheduler import run_algorithm
+from simulation.gantt import assign_lanes, bucket_occupancy, merge_slices, prepare, segments_xy, spread, view
+from simulation.smp import smp_schedule
+from simulation.workload import DEFAULT_PROCESSES, generate_workload, iter_processes
+
+
+def test_merge_joins_back_to_back_slices_per_lane():
+    lane = np.array([1, 0, 0, 0, 1])
+    start = np.array([0.0, 2.0, 0.0, 5.0, 1.0])
+    finish = np.array([1.0, 4.0, 2.0, 6.0, 3.0])
+    l, s, f = merge_slices(lane, start, finish)
+    assert l.tolist() == [0, 0, 1]
+    assert s.tolist() == [0.0, 5.0, 0.0]
+    assert f.tolist() == [4.0, 6.0, 3.0]
+
+
+def test_prepare_merges_repeated_dispatches():
+    log, _ = run_algorithm("rr", [{"pid": "A", "arrival": 0, "burst": 6}], quantum=2)
+    data = prepare(log)
+    assert data["slices"] == 3
+    assert data["start"].tolist() == [0.0] and data["finish"].tolist() == [6.0]
+
+
+def test_lanes_band_past_max_lanes():
+    log, _ = run_algorithm("fcfs", list(iter_processes(generate_workload(1_000, seed=1))))
+    lane, labels = assign_lanes(log, max_lanes=40)
+    assert len(labels) == 40
+    assert lane.min() == 0 and lane.max() == 39
+    assert np.all(np.diff(lane[np.argsort(log.pid_index)]) >= 0)   # bands hold consecutive pids
+
+
+def test_core_lanes_need_a_core_column():
+    log, _ = smp_schedule(DEFAULT_PROCESSES, cores=2)
+    lane, labels = assign_lanes(log, by="core")
+    assert labels.tolist() == ["cpu0", "cpu1"]
+    with pytest.raises(ValueError):
+        assign_lanes(run_algorithm("fcfs", DEFAULT_PROCESSES)[0], by="core")
+
+
+def reference_occupancy(lane, start, finish, n_lanes, t0, width, buckets):
+    occ = np.zeros((n_lanes, buckets))
+    for l, s, f in zip(lane, start, finish):
+        for b in range(buckets):
+            lo, hi = t0 + b * width, t0 + (b + 1) * width
+            occ[l, b] += max(0.0, min(f, hi) - max(s, lo))
+    return occ / width
+
+
+def test_bucket_occupancy_matches_interval_overlap():
+    rng = np.random.default_rng(6)
+    for _ in range(100):
+        n, n_lanes, buckets = int(rng.integers(0, 40)), int(rng.integers(1, 5)), int(rng.integers(1, 30))
+        lane = rng.integers(0, n_lanes, n)
+        start = rng.uniform(-5, 50, n)
+        finish = start + rng.exponential(6, n)
+        t0, width = float(rng.uniform(-2, 10)), float(rng.uniform(0.3, 3))
+        got = bucket_occupancy(lane, start, finish, n_lanes, t0, width, buckets)
+        assert got.dtype == np.float64
+        assert np.allclose(got, reference_occupancy(lane, start, finish, n_lanes, t0, width, buckets))
+
+
+def test_bucket_occupancy_with_nothing_in_window():
+    empty = np.zeros(0)
+    occ = bucket_occupancy(np.zeros(0, np.int32), empty, empty, 1, 0.0, 1.0, 1)
+    assert occ.tolist() == [[0.0]]
+
+
+def test_view_switches_to_buckets_past_max_segments():
+    log, _ = smp_schedule(list(iter_processes(generate_workload(3_000, seed=2))), cores=4, algo="rr")
+    data = prepare(log, by="core")
+    exact = view(data, max_segments=10 ** 9)
+    assert exact["mode"] == "slices" and len(exact["traces"][0]["start"]) == len(data["start"])
+    coarse = view(data, max_segments=500)
+    assert coarse["mode"] == "buckets"
+    drawn = sum(float(np.sum(tr["finish"] - tr["start"])) for tr in coarse["traces"])
+    assert 0 < drawn <= data["t_max"] * 4 + 1e-6
+    zoom = view(data, data["t_min"], data["t_min"] + 1.0, max_segments=500)
+    assert zoom["mode"] == "slices"
+    assert np.all(zoom["traces"][0]["finish"] > data["t_min"])
+
+
+def test_segments_xy_layout():
+    x, y = segments_xy(np.array([0, 2]), np.array([1.0, 3.0]), np.array([2.0, 5.0]))
+    assert x[[0, 1, 3, 4]].tolist() == [1.0, 2.0, 3.0, 5.0] and np.isnan(x[[2, 5]]).all()
+    assert y[[0, 1, 3, 4]].tolist() == [0, 0, 2, 2] and np.isnan(y[[2, 5]]).all()
+    assert spread(np.array(["a"], dtype=object)).tolist() == ["a", "a", None]
@@ -0,0 +1,132 @@
+# tests/test_paging.py — Replacement policies against naive list-based references
+import io
+
+import numpy as np
+import pytest
+
+from simulation.paging import POLICIES, iter_refs, lru_hit_ratio_curve, simulate_paging, stack_distances
+
+BELADY = [1, 2, 3, 4, 1, 2, 5, 1, 2, 3, 4, 5]
+
+
+def naive_faults(refs, frames, policy):
+    """Fault count from a plain list of resident pages (O(frames) per reference)"""
+    mem, faults = [], 0
+    for i, page in enumerate(refs):
+        if page in mem:
+            if policy == "LRU":
+                mem.remove(page); mem.append(page)
+            continue
+        faults += 1
+        if len(mem) >= frames:
+            if policy == "OPT":
+                rest = refs[i + 1:]
+                victim = max(mem, key=lambda q: rest.index(q) if q in rest else len(rest))
+                mem.remove(victim)
+            else:
+                mem.pop(0)
+        mem.append(page)
+    return faults
+
+
+def random_refs(rng, n=400, pages=12):
+    # a hot set plus a uniform tail, so every policy sees both hits and faults
+    hot = rng.integers(0, 4, n)
+    cold = rng.integers(0, pages, n)
+    return np.where(rng.random(n) < 0.6, hot, cold).tolist()
+
+
+@pytest.mark.parametrize("frames, faults", [(3, 9), (4, 10)])
+def test_fifo_belady_anomaly(frames, faults):
+    assert simulate_paging(BELADY, frames, "FIFO", timeline=False)[1] == faults
+
+
+@pytest.mark.parametrize("policy", ["FIFO", "LRU", "OPT"])
+def test_matches_naive_reference(policy):
+    rng = np.random.default_rng(11)
+    for _ in range(50):
+        refs = random_refs(rng)
+        for frames in (1, 2, 3, 5, 8):
+            assert simulate_paging(refs, frames, policy, timeline=False)[1] == naive_faults(refs, frames, policy)
+
+
+@pytest.mark.parametrize("policy", sorted(POLICIES))
+def test_resident_set_and_bounds(policy):
+    rng = np.random.default_rng(5)
+    refs = random_refs(rng, n=2_000, pages=30)
+    opt = simulate_paging(refs, 4, "OPT", timeline=False)[1]
+    rows, faults, hit_ratio = simulate_paging(refs, 4, policy)
+    assert faults >= opt                                   # nothing beats Belady
+    assert hit_ratio == pytest.approx(1 - faults / len(refs))
+    assert sum(not r["hit"] for r in rows) == faults
+    for r in rows:
+        assert len(r["frames"]) <= 4
+        assert len(set(r["frames"])) == len(r["frames"])
+        assert r["page"] in r["frames"]
+
+
+def test_arc_ghost_lists_stay_bounded():
+    rng = np.random.default_rng(2)
+    arc = POLICIES["ARC"](5)
+    for page in random_refs(rng, n=5_000, pages=40):
+        arc.access(page)
+        assert len(arc.t1) + len(arc.t2) <= arc.c
+        assert len(arc.t1) + len(arc.b1) <= arc.c
+        assert len(arc.t1) + len(arc.t2) + len(arc.b1) + len(arc.b2) <= 2 * arc.c
+        assert 0 <= arc.p <= arc.c
+        assert not (set(arc.t1) | set(arc.t2)) & (set(arc.b1) | set(arc.b2))
+
+
+def test_sampled_timeline():
+    rows, faults, _ = simulate_paging(BELADY, 3, "LRU", sample_every=5)
+    assert [r["t"] for r in rows] == [0, 5, 10]
+    assert faults == simulate_paging(BELADY, 3, "LRU", timeline=False)[1]
+
+
+def test_frames_must_be_positive():
+    with pytest.raises(ValueError):
+        simulate_paging(BELADY, 0)
+
+
+def test_iter_refs_across_chunk_boundaries():
+    text = "10 200,3\n4000 5,\n66 7"
+    for chunk in (1, 2, 3, 7, 64):
+        assert list(iter_refs(io.StringIO(text), chunk_bytes=chunk)) == [10, 200, 3, 4000, 5, 66, 7]
+
+
+# ---------------- Stack-distance curve ----------------
+def naive_stack_distances(refs):
+    stack, out = [], []
+    for page in refs:
+        if page in stack:
+            out.append(stack.index(page) + 1)
+            stack.remove(page)
+        else:
+            out.append(0)
+        stack.insert(0, page)
+    return out
+
+
+def test_stack_distances_match_lru_stack():
+    rng = np.random.default_rng(3)
+    for _ in range(30):
+        refs = random_refs(rng, n=300, pages=20)
+        assert stack_distances(refs).tolist() == naive_stack_distances(refs)
+
+
+def test_curve_matches_per_frame_lru():
+    rng = np.random.default_rng(8)
+    refs = random_refs(rng, n=3_000, pages=25)
+    curve = lru_hit_ratio_curve(iter(refs), max_frames=30)
+    assert curve["frames"].tolist() == list(range(1, 31))
+    for f, hit in zip(curve["frames"].tolist(), curve["hit_ratio"]):
+        assert hit == pytest.approx(simulate_paging(refs, f, "LRU", timeline=False)[2])
+    assert np.allclose(curve["hit_ratio"] + curve["miss_ratio"], 1.0)
+    assert np.all(np.diff(curve["hit_ratio"]) >= 0)
+
+
+def test_curve_of_first_touches_only():
+    curve = lru_hit_ratio_curve([1, 2, 3])
+    assert curve["frames"].tolist() == [1]
+    assert curve["hit_ratio"].tolist() == [0.0]
+    assert lru_hit_ratio_curve([])["miss_ratio"].tolist() == [1.0]
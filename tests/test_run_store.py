@@ -0,0 +1,46 @@
+# tests/test_run_store.py — Run store manifest: per-workload comparison, reload fidelity
+import pytest
+
+from simulation.cpu_scheduler import run_algorithm
+from simulation.run_store import RunStore
+from simulation.workload import DEFAULT_PROCESSES, generate_workload, iter_processes
+
+pytest.importorskip("pyarrow")
+
+
+def save(store, algo, workload, seed=0, cores=1):
+    procs = DEFAULT_PROCESSES if workload == "default" else list(iter_processes(generate_workload(200, seed=seed)))
+    log, _ = run_algorithm(algo, procs)
+    return store.save_run(log, None, algo.upper(), params={"workload": workload, "seed": seed, "cores": cores})
+
+
+def test_latest_runs_are_kept_per_workload(tmp_path):
+    store = RunStore(str(tmp_path))
+    save(store, "fcfs", "default")
+    save(store, "sjf", "default")
+    save(store, "fcfs", "random:200", seed=1)
+    latest = save(store, "fcfs", "default")
+    df = store.summary(latest_only=True)
+    assert sorted(zip(df["Algorithm"], df["workload"])) == [
+        ("FCFS", "default"), ("FCFS", "random:200"), ("SJF", "default")]
+    assert latest in df["run_id"].tolist()
+
+
+def test_summary_filters_to_one_workload(tmp_path):
+    store = RunStore(str(tmp_path))
+    save(store, "fcfs", "default")
+    save(store, "fcfs", "random:200", seed=1)
+    save(store, "sjf", "random:200", seed=2)
+    assert store.workloads() == [("random:200", 2, 1), ("random:200", 1, 1), ("default", 0, 1)]
+    df = store.summary(latest_only=True, workload=("random:200", 1, 1))
+    assert df["Algorithm"].tolist() == ["FCFS"]
+    assert store.summary(workload=("nope", 0, 1)).empty
+
+
+def test_older_entries_without_workload_params(tmp_path):
+    store = RunStore(str(tmp_path))
+    log, _ = run_algorithm("fcfs", DEFAULT_PROCESSES)
+    store.save_run(log, None, "FCFS")
+    store.save_run(log, None, "FCFS")
+    assert store.workloads() == [(None, None, None)]
+    assert len(store.summary(latest_only=True)) == 1
@@ -0,0 +1,112 @@
+# tests/test_sandbox.py — Sandbox pool: statuses, wall-clock limit with background children, env isolation
+import os
+import sys
+import time
+
+import pytest
+
+from sandbox import SandboxPool
+
+pytestmark = pytest.mark.skipif(os.name != "posix", reason="limits rely on setrlimit and process groups")
+
+
+@pytest.fixture(scope="module")
+def pool():
+    os.environ["XAI_SANDBOX_TEST_SECRET"] = "hunter2"   # set before the workers start
+    p = SandboxPool(size=2, cpu_seconds=2, memory_mb=256, timeout=5.0, max_output=10_000)
+    yield p
+    p.close()
+    del os.environ["XAI_SANDBOX_TEST_SECRET"]
+
+
+def alive(pid, grace=2.0):
+    """True if `pid` is still running after `grace` seconds (SIGKILL lands asynchronously)"""
+    deadline = time.monotonic() + grace
+    while _running(pid) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    return _running(pid)
+
+
+def _running(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    # a zombie still answers signal 0
+    try:
+        with open(f"/proc/{pid}/stat") as fh:
+            return fh.read().split(") ")[-1][0] != "Z"
+    except FileNotFoundError:
+        return False
+
+
+def test_ok_and_error(pool):
+    res = pool.run("print(6 * 7)")
+    assert res["status"] == "ok" and res["stdout"] == "42\n" and res["returncode"] == 0
+    res = pool.run("raise KeyError('boom')")
+    assert res["status"] == "error" and "KeyError" in res["stderr"]
+
+
+def test_timeout(pool):
+    res = pool.run("import time\nwhile True: time.sleep(0.1)", timeout=1.0)
+    assert res["status"] == "timeout"
+    assert res["wall_s"] < 3
+
+
+BACKGROUND = "import subprocess, sys\np = subprocess.Popen(['sleep', '{secs}'])\nprint(p.pid)\n{tail}"
+
+
+def test_background_child_cannot_outlast_the_timeout(pool):
+    res = pool.run(BACKGROUND.format(secs=60, tail="import time\ntime.sleep(60)"), timeout=1.0)
+    assert res["status"] == "timeout"
+    assert res["wall_s"] < 3
+    assert not alive(int(res["stdout"]))
+
+
+def test_background_child_killed_when_job_finishes(pool):
+    t0 = time.perf_counter()
+    res = pool.run(BACKGROUND.format(secs=60, tail=""), timeout=2.0)
+    assert res["status"] == "ok"
+    assert time.perf_counter() - t0 < 3
+    assert not alive(int(res["stdout"]))
+
+
+def test_cpu_limit(pool):
+    res = pool.run("while True: pass", cpu_seconds=1, timeout=10.0)
+    assert res["status"] == "cpu_limit"
+
+
+def test_memory_limit(pool):
+    res = pool.run("x = bytearray(1024 * 2 ** 20)", memory_mb=128)
+    assert res["status"] == "memory_limit"
+    assert "memory limit" in res["stderr"]
+
+
+def test_output_limit_on_stderr(pool):
+    res = pool.run("import sys\nwhile True: sys.stderr.write('x' * 4096)")
+    assert res["status"] == "output_limit"
+    assert len(res["stderr"].encode()) <= pool.max_output + 4096
+
+
+def test_stdout_is_truncated_in_the_worker(pool):
+    res = pool.run("print('y' * 50_000)")
+    assert res["status"] == "ok"
+    assert res["stdout"].endswith("… output truncated\n")
+
+
+def test_server_environment_is_not_inherited(pool):
+    res = pool.run("import os\nprint(sorted(os.environ))")
+    assert res["status"] == "ok"
+    assert "XAI_SANDBOX_TEST_SECRET" not in res["stdout"]
+    assert "PATH" in res["stdout"] and "OMP_NUM_THREADS" in res["stdout"]
+
+
+def test_idle_pool_never_grows_past_size():
+    p = SandboxPool(size=1, timeout=5.0)
+    try:
+        futures = [p.submit("pass") for _ in range(6)]
+        assert all(f.result()["status"] == "ok" for f in futures)
+        time.sleep(1.0)   # let background replacements land
+        assert p._idle.qsize() + p._warming <= 1
+    finally:
+        p.close()
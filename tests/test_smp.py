@@ -0,0 +1,73 @@
+# tests/test_smp.py — SMP model: 1-core equivalence, per-core exclusivity, conservation of work
+import numpy as np
+import pytest
+
+from simulation.cpu_scheduler import run_algorithm
+from simulation.run_store import RunStore
+from simulation.schedule import ScheduleLog, perf_from_schedule
+from simulation.smp import BALANCERS, SMP_ALGOS, smp_schedule
+from simulation.workload import DEFAULT_PROCESSES, generate_workload, iter_processes
+
+
+def workload(seed, n=500):
+    return list(iter_processes(generate_workload(n, seed=seed)))
+
+
+def columns(log):
+    return log.pid_index.tolist(), log.start.tolist(), log.finish.tolist()
+
+
+@pytest.mark.parametrize("algo", SMP_ALGOS)
+@pytest.mark.parametrize("balance", BALANCERS)
+def test_one_core_reproduces_single_cpu(algo, balance):
+    for seed in range(5):
+        procs = workload(seed)
+        log, stats = smp_schedule(procs, cores=1, algo=algo, quantum=2, balance=balance, balance_interval=3.0)
+        ref, _ = run_algorithm(algo, procs, quantum=2)
+        assert columns(log) == columns(ref)
+        assert stats["migrations"] == 0
+
+
+@pytest.mark.parametrize("algo", SMP_ALGOS)
+@pytest.mark.parametrize("balance", BALANCERS)
+@pytest.mark.parametrize("cores", [2, 3, 8])
+def test_cores_run_one_slice_at_a_time_and_finish_every_burst(algo, balance, cores):
+    procs = workload(cores, n=800)
+    log, stats = smp_schedule(procs, cores=cores, algo=algo, quantum=2, balance=balance, balance_interval=5.0)
+    for c in range(cores):
+        on = log.core == c
+        order = np.argsort(log.start[on], kind="stable")
+        s, f = log.start[on][order], log.finish[on][order]
+        assert np.all(s[1:] >= f[:-1] - 1e-9)
+    # a pid never runs on two cores at once
+    for i in np.unique(log.pid_index):
+        mine = log.pid_index == i
+        s, f = np.sort(log.start[mine]), np.sort(log.finish[mine])
+        assert np.all(s[1:] >= f[:-1] - 1e-9)
+    assert np.all(log.start >= log.arrival - 1e-9)
+    ran = np.bincount(log.pid_index, weights=log.finish - log.start, minlength=len(procs))
+    assert np.allclose(ran, [p["burst"] for p in procs])
+    assert stats["busy"].sum() == pytest.approx(sum(p["burst"] for p in procs))
+    assert np.all(stats["utilization"] <= 100.0 + 1e-9)
+    if balance == "none":
+        assert stats["migrations"] == 0
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"algo": "srtf"}, {"balance": "random"}, {"cores": 0}, {"algo": "rr", "quantum": 0},
+])
+def test_bad_arguments(kwargs):
+    with pytest.raises(ValueError):
+        smp_schedule(workload(0, n=5), **kwargs)
+
+def test_idle_cores_survive_a_round_trip(tmp_path):
+    # 3 processes on 16 cores: 13 cores never run a slice
+    log, _ = smp_schedule(DEFAULT_PROCESSES, cores=16)
+    util = log.metrics()["cpu_util"]
+    assert ScheduleLog.from_pandas(log.to_pandas()).cores == 16
+    pytest.importorskip("pyarrow")
+    store = RunStore(str(tmp_path))
+    run_id = store.save_run(log, None, "FCFS × 16", params={"cores": 16})
+    df = store.load(run_id, "schedule")
+    assert perf_from_schedule(df)["cpu_util"] == pytest.approx(util)
+    assert ScheduleLog.from_pandas(df).per_core().shape == (16,)
@@ -0,0 +1,68 @@
+# tests/test_xai.py — Decision writer: declared columns, no silently dropped fields
+import csv
+
+import pandas as pd
+import pytest
+
+from simulation.cpu_scheduler import SCHEDULERS, run_algorithm
+from simulation.workload import generate_workload, iter_processes
+from simulation.xai import REASON_FIELDS, DecisionWriter, Reason, reason_text
+
+BASE = {"algo": "X", "time": 0.0, "pid_chosen": "P1", "arrival": 0.0, "burst": 2.0, "ready_count": 1, "now": 0.0}
+
+
+def decision(reason, **extra):
+    return {**BASE, "reason_code": reason.value, **dict.fromkeys(REASON_FIELDS[reason], 1.5), **extra}
+
+
+def read(path):
+    return pd.read_parquet(path) if path.endswith(".parquet") else pd.read_csv(path)
+
+
+@pytest.fixture(params=["parquet", "csv"])
+def path(request, tmp_path):
+    if request.param == "parquet":
+        pytest.importorskip("pyarrow")
+    return str(tmp_path / f"decisions.{request.param}")
+
+
+@pytest.mark.parametrize("algo", sorted(SCHEDULERS))
+def test_scheduler_decisions_round_trip(algo, path):
+    procs = list(iter_processes(generate_workload(300, seed=4)))
+    with DecisionWriter(path, batch_rows=64) as writer:
+        _, decisions = run_algorithm(algo, procs, quantum=2)
+        writer.write_all(decisions)
+    df = read(path)
+    assert len(df) == writer.count == len(decisions)
+    assert list(df.columns) == list(decisions[0])
+    assert [reason_text(r) for r in df.head(20).to_dict("records")] == [reason_text(d) for d in decisions[:20]]
+
+
+def test_declared_reasons_get_columns_before_their_rows_appear(path):
+    rows = [decision(Reason.SHORTEST_BURST)] * 3 + [decision(Reason.SHORTEST_REMAINING)]
+    with DecisionWriter(path, batch_rows=3, reasons=[Reason.SHORTEST_REMAINING]) as writer:
+        writer.write_all(rows)
+    df = read(path)
+    assert set(REASON_FIELDS[Reason.SHORTEST_REMAINING]) <= set(df.columns)
+    assert df["min_remaining_ready"].isna().tolist() == [True, True, True, False]
+
+
+def test_undeclared_fields_raise_instead_of_dropping(path):
+    writer = DecisionWriter(path, batch_rows=2)
+    writer.write_all([decision(Reason.SHORTEST_BURST)] * 2)
+    with pytest.raises(ValueError, match="min_remaining_ready"):
+        writer.write_all([decision(Reason.SHORTEST_REMAINING)] * 2)
+    with pytest.raises(ValueError, match="preempted_by"):
+        writer.write_all([decision(Reason.SHORTEST_BURST, preempted_by="P2")] * 2)
+    writer.close()
+
+
+def test_first_batch_mixing_reasons(path):
+    rows = [decision(Reason.EARLIEST_ARRIVAL), {**decision(Reason.RR_QUEUE_ORDER), "algo": "RR"}]
+    with DecisionWriter(path) as writer:
+        writer.write_all(rows)
+    df = read(path)
+    assert df["quantum_used"].isna().tolist() == [True, False]
+    if path.endswith(".csv"):
+        with open(path, newline="") as fh:
+            assert next(csv.reader(fh))[:len(BASE) + 1] == list(rows[0])[:len(BASE) + 1]